@@ -9,13 +9,17 @@ __version__ = "0.1.0"
 __author__ = "MCP Readiness Scanner Contributors"
 __license__ = "Apache-2.0"
 
+from typing import TYPE_CHECKING
+
 from mcpreadiness.core.models import (
     Finding,
     OperationalRiskCategory,
     ScanResult,
     Severity,
 )
-from mcpreadiness.core.orchestrator import ScanOrchestrator
+
+if TYPE_CHECKING:
+    from mcpreadiness.core.orchestrator import ScanOrchestrator
 
 __all__ = [
     "Finding",
@@ -24,3 +28,12 @@ __all__ = [
     "OperationalRiskCategory",
     "ScanOrchestrator",
 ]
+
+
+def __getattr__(name: str):
+    # ScanOrchestrator pulls in the provider stack, so import it on first use
+    if name == "ScanOrchestrator":
+        from mcpreadiness.core.orchestrator import ScanOrchestrator
+
+        return ScanOrchestrator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
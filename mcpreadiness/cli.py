@@ -7,6 +7,7 @@ for operational readiness issues.
 
 import asyncio
 import json
+import os
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -22,7 +23,7 @@ from mcpreadiness.core.taxonomy import CATEGORY_DESCRIPTIONS, OperationalRiskCat
 from mcpreadiness.providers.base import InspectionProvider
 from mcpreadiness.reports.json_report import render_json
 from mcpreadiness.reports.markdown_report import render_markdown
-from mcpreadiness.reports.sarif import render_sarif
+from mcpreadiness.reports.sarif import render_sarif, render_sarif_stream
 
 # Output format options
 OUTPUT_FORMATS = ["json", "markdown", "sarif", "html"]
@@ -90,6 +91,22 @@ def output_result(
     verbose: bool,
 ) -> None:
     """Output scan result in the specified format."""
+    if format == "sarif" and output_file:
+        # Stream large SARIF reports to a temporary file next to the output
+        # and move it into place, so a failed render leaves no partial file
+        path = Path(output_file)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as fp:
+                render_sarif_stream(result, fp)
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        if verbose:
+            click.echo(f"Output written to: {output_file}", err=True)
+        return
+
     if format == "json":
         content = render_json(result, indent=2 if verbose else None)
     elif format == "markdown":
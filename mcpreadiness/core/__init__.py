@@ -1,14 +1,18 @@
 """Core components for MCP Readiness Scanner."""
 
+from typing import TYPE_CHECKING
+
 from mcpreadiness.core.models import (
     Finding,
     OperationalRiskCategory,
     ScanResult,
     Severity,
 )
-from mcpreadiness.core.orchestrator import ScanOrchestrator
 from mcpreadiness.core.taxonomy import CATEGORY_DESCRIPTIONS
 
+if TYPE_CHECKING:
+    from mcpreadiness.core.orchestrator import ScanOrchestrator
+
 __all__ = [
     "Finding",
     "ScanResult",
@@ -17,3 +21,12 @@ __all__ = [
     "ScanOrchestrator",
     "CATEGORY_DESCRIPTIONS",
 ]
+
+
+def __getattr__(name: str):
+    # ScanOrchestrator pulls in the provider stack, so import it on first use
+    if name == "ScanOrchestrator":
+        from mcpreadiness.core.orchestrator import ScanOrchestrator
+
+        return ScanOrchestrator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,6 +7,7 @@ Handles suppression of findings based on:
 - .mcp-readiness-ignore files
 """
 
+import sys
 from pathlib import Path
 from typing import Any
 
@@ -16,6 +17,8 @@ from mcpreadiness.core.models import Finding
 class SuppressionManager:
     """Manages rule suppression from multiple sources."""
 
+    __slots__ = ("cli_ignore_rules", "ignore_file_rules", "_all_suppressed")
+
     def __init__(
         self,
         cli_ignore_rules: list[str] | None = None,
@@ -28,28 +31,47 @@ class SuppressionManager:
             cli_ignore_rules: Rules to ignore from CLI flags
             ignore_file_path: Path to .mcp-readiness-ignore file
         """
-        self.cli_ignore_rules = set(cli_ignore_rules or [])
+        # Rule IDs are interned so membership tests can hit the identity fast path
+        self.cli_ignore_rules = {sys.intern(r) for r in (cli_ignore_rules or [])}
         self.ignore_file_rules: set[str] = set()
 
         if ignore_file_path:
             self._load_ignore_file(Path(ignore_file_path))
 
+        # CLI and file rules are fixed after construction, so freeze them once
+        self._all_suppressed: frozenset[str] = frozenset(
+            self.cli_ignore_rules | self.ignore_file_rules
+        )
+
     def _load_ignore_file(self, path: Path) -> None:
         """
         Load rules from .mcp-readiness-ignore file.
 
         Format: One rule ID per line, comments start with #
         """
-        if not path.exists():
+        try:
+            text = path.read_text(encoding="utf-8")
+        except FileNotFoundError:
             return
 
-        with open(path, encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                # Skip empty lines and comments
-                if not line or line.startswith("#"):
-                    continue
-                self.ignore_file_rules.add(line)
+        # Skip empty lines and comments
+        self.ignore_file_rules.update(
+            sys.intern(line)
+            for line in (raw.strip() for raw in text.splitlines())
+            if line and not line.startswith("#")
+        )
+
+    @staticmethod
+    def _inline_rules(tool_definition: dict[str, Any]) -> frozenset[str]:
+        """
+        Get the inline suppressed rule IDs of a tool definition as a set.
+
+        A single rule ID given as a string is treated as a one-rule list.
+        """
+        inline_ignore = tool_definition.get("mcp-readiness-ignore", ())
+        if isinstance(inline_ignore, str):
+            return frozenset((inline_ignore,))
+        return frozenset(inline_ignore)
 
     def is_suppressed(
         self,
@@ -66,19 +88,16 @@ class SuppressionManager:
         Returns:
             True if the finding should be suppressed
         """
-        # Check CLI flags
-        if finding.rule_id and finding.rule_id in self.cli_ignore_rules:
-            return True
+        if not finding.rule_id:
+            return False
 
-        # Check ignore file
-        if finding.rule_id and finding.rule_id in self.ignore_file_rules:
+        # Check CLI flags and ignore file
+        if finding.rule_id in self._all_suppressed:
             return True
 
         # Check inline suppression in tool definition
         if tool_definition:
-            inline_ignore = tool_definition.get("mcp-readiness-ignore", [])
-            if finding.rule_id and finding.rule_id in inline_ignore:
-                return True
+            return finding.rule_id in self._inline_rules(tool_definition)
 
         return False
 
@@ -97,18 +116,34 @@ class SuppressionManager:
         Returns:
             Tuple of (active_findings, suppressed_findings)
         """
-        active = []
-        suppressed = []
-
+        # Convert the inline list once per call so every finding is a set lookup
+        if tool_definition:
+            suppressed_ids = self._all_suppressed | self._inline_rules(tool_definition)
+        else:
+            suppressed_ids = self._all_suppressed
+
+        # Nothing configured: every finding stays active
+        if not suppressed_ids:
+            # Copy rather than alias the caller's list; list.copy() skips
+            # the iterator protocol that list() goes through
+            return (findings.copy() if isinstance(findings, list) else list(findings)), []
+
+        active: list[Finding] = []
+        suppressed: list[Finding] = []
+
+        # Partition in a single pass with pre-bound methods
+        active_append = active.append
+        suppressed_append = suppressed.append
+        contains = suppressed_ids.__contains__
         for finding in findings:
-            if self.is_suppressed(finding, tool_definition):
-                suppressed.append(finding)
+            if contains(finding.rule_id):
+                suppressed_append(finding)
             else:
-                active.append(finding)
+                active_append(finding)
 
         return active, suppressed
 
-    def get_all_suppressed_rules(self) -> set[str]:
-        """Get all suppressed rule IDs from all sources."""
-        return self.cli_ignore_rules | self.ignore_file_rules
+    def get_all_suppressed_rules(self) -> frozenset[str]:
+        """Get all suppressed rule IDs from CLI flags and the ignore file."""
+        return self._all_suppressed
 
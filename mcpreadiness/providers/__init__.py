@@ -9,7 +9,11 @@ Supports custom providers via entry points:
   my_provider = "my_package.providers:MyProvider"
 """
 
+import importlib
 import sys
+from functools import cache
+from types import MappingProxyType
+from typing import Any
 
 from mcpreadiness.providers.base import InspectionProvider
 from mcpreadiness.providers.heuristic_provider import HeuristicProvider
@@ -18,26 +22,38 @@ from mcpreadiness.providers.llm_judge_provider import LLMJudgeProvider
 # Plugin discovery
 if sys.version_info >= (3, 10):
     from importlib.metadata import entry_points
+
+    def _select_eps(group: str) -> Any:
+        return entry_points().select(group=group)
+
 else:
     from importlib_metadata import entry_points  # type: ignore
 
-# Conditional imports for optional providers
-_yara_available = False
-_opa_available = False
+    def _select_eps(group: str) -> Any:
+        return entry_points().get(group, [])
+
+# Optional providers are imported on first access so that their heavy
+# dependencies (yara-python, subprocess machinery) are not loaded on every
+# package import. A missing dependency resolves the attribute to None.
+_OPTIONAL_PROVIDERS = {
+    "YaraProvider": "mcpreadiness.providers.yara_provider",
+    "OpaProvider": "mcpreadiness.providers.opa_provider",
+}
 
-try:
-    from mcpreadiness.providers.yara_provider import YaraProvider
 
-    _yara_available = True
-except ImportError:
-    YaraProvider = None  # type: ignore
+def __getattr__(name: str) -> Any:
+    module_name = _OPTIONAL_PROVIDERS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-try:
-    from mcpreadiness.providers.opa_provider import OpaProvider
+    try:
+        provider_class = getattr(importlib.import_module(module_name), name)
+    except ImportError:
+        provider_class = None
+
+    globals()[name] = provider_class
+    return provider_class
 
-    _opa_available = True
-except ImportError:
-    OpaProvider = None  # type: ignore
 
 __all__ = [
     "InspectionProvider",
@@ -53,64 +69,100 @@ def get_default_providers() -> list["InspectionProvider"]:
     Get all available providers with default configuration.
 
     Returns providers that are available (dependencies installed, etc.)
+    Availability is probed once per process; fresh provider instances are
+    created on every call.
     """
-    providers: list[InspectionProvider] = []
+    return [provider_class() for provider_class in _default_provider_classes()]
+
+
+@cache
+def _default_provider_classes() -> tuple[type[InspectionProvider], ...]:
+    """Find the default provider classes that are available, once."""
+    provider_classes: list[type[InspectionProvider]] = []
 
     # Heuristic provider is always available (no external deps)
-    providers.append(HeuristicProvider())
+    provider_classes.append(HeuristicProvider)
 
     # YARA provider if yara-python is installed
-    if YaraProvider is not None:
-        yara = YaraProvider()
-        if yara.is_available():
-            providers.append(yara)
+    try:
+        from mcpreadiness.providers.yara_provider import YaraProvider
+    except ImportError:
+        pass
+    else:
+        if YaraProvider.is_available_static() and YaraProvider().is_available():
+            provider_classes.append(YaraProvider)
 
     # OPA provider if opa binary is in PATH
-    if OpaProvider is not None:
-        opa = OpaProvider()
-        if opa.is_available():
-            providers.append(opa)
+    try:
+        from mcpreadiness.providers.opa_provider import OpaProvider
+    except ImportError:
+        pass
+    else:
+        if OpaProvider.is_available_static() and OpaProvider().is_available():
+            provider_classes.append(OpaProvider)
 
     # LLM provider is disabled by default, not included here
 
-    return providers
+    return tuple(provider_classes)
+
+
+@cache
+def _all_provider_classes() -> tuple[type, ...]:
+    """Build the provider class tuple once, importing optional providers lazily."""
+    return tuple(
+        cls
+        for cls in (
+            HeuristicProvider,
+            __getattr__("YaraProvider"),
+            __getattr__("OpaProvider"),
+            LLMJudgeProvider,
+        )
+        if cls is not None
+    )
 
 
 def get_all_provider_classes() -> list[type]:
     """Get all provider classes (including unavailable ones)."""
-    classes: list[type] = [HeuristicProvider]
-    if YaraProvider is not None:
-        classes.append(YaraProvider)
-    if OpaProvider is not None:
-        classes.append(OpaProvider)
-    classes.append(LLMJudgeProvider)
-    return classes
+    return list(_all_provider_classes())
+
+
+@cache
+def _ep_select(group: str) -> tuple:
+    """
+    Look up entry points for a group, caching the result.
+
+    ``entry_points()`` scans the metadata of every installed distribution,
+    so the lookup is only performed once per group per process.
+    """
+    return tuple(_select_eps(group))
 
 
 def discover_custom_providers() -> dict[str, type[InspectionProvider]]:
     """
     Discover custom providers via entry points.
 
+    Discovery runs once for the lifetime of the process, so entry points
+    registered at runtime are not seen until ``_reset_provider_cache()``
+    is called. Each call returns a new dictionary that the caller may
+    modify.
+
     Returns:
         Dictionary mapping provider names to provider classes
     """
+    return dict(_custom_providers())
+
+
+@cache
+def _custom_providers() -> MappingProxyType[str, type[InspectionProvider]]:
+    """Load the entry point providers once, as a read-only mapping."""
     custom_providers: dict[str, type[InspectionProvider]] = {}
 
     try:
-        # Python 3.10+ API
-        if hasattr(entry_points(), "select"):
-            eps = entry_points().select(group="mcp_readiness.providers")
-        else:
-            # Python 3.9 API
-            eps = entry_points().get("mcp_readiness.providers", [])
-
-        for ep in eps:
+        for ep in _ep_select("mcp_readiness.providers"):
             try:
                 provider_class = ep.load()
                 # Validate it's a subclass of InspectionProvider
-                if isinstance(provider_class, type) and issubclass(
-                    provider_class, InspectionProvider
-                ):
+                if isinstance(provider_class, type) and issubclass(provider_class, InspectionProvider):
                     custom_providers[ep.name] = provider_class
                 else:
                     import warnings
@@ -128,7 +180,15 @@ def discover_custom_providers() -> dict[str, type[InspectionProvider]]:
 
         warnings.warn(f"Failed to discover custom providers: {e}")
 
-    return custom_providers
+    return MappingProxyType(custom_providers)
+
+
+def _reset_provider_cache() -> None:
+    """Clear cached provider classes, entry point lookups and custom providers."""
+    _default_provider_classes.cache_clear()
+    _all_provider_classes.cache_clear()
+    _custom_providers.cache_clear()
+    _ep_select.cache_clear()
 
 
 def get_all_providers_with_plugins() -> list[InspectionProvider]:
@@ -0,0 +1,41 @@
+"""
+Counting loops used by the heuristic provider.
+
+Kept in a small, fully typed module so the optional mypyc build can compile
+them to C loops (see the mypyc build hook in pyproject.toml). The module is
+plain Python and behaves the same when not compiled.
+"""
+
+from typing import Any
+
+
+def count_non_generic(words: list[str], generic: frozenset[str], limit: int) -> int:
+    """
+    Count the words that are not in ``generic``, stopping once ``limit`` is reached.
+    """
+    count = 0
+    for word in words:
+        if word not in generic:
+            count += 1
+            if count >= limit:
+                break
+    return count
+
+
+def unvalidated_properties(
+    properties: dict[str, Any], keywords: frozenset[str], limit: int
+) -> tuple[int, list[str]]:
+    """
+    Count the dict-valued properties that use none of ``keywords``.
+
+    Returns the count and the names of the first ``limit`` such properties;
+    names past the limit are counted but not collected.
+    """
+    count = 0
+    names: list[str] = []
+    for name, definition in properties.items():
+        if isinstance(definition, dict) and keywords.isdisjoint(definition):
+            count += 1
+            if count <= limit:
+                names.append(name)
+    return count, names
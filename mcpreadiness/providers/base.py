@@ -106,6 +106,21 @@ class InspectionProvider(ABC):
         """
         return True
 
+    @classmethod
+    def is_available_static(cls) -> bool:
+        """
+        Cheaply check if this provider could run, without instantiating it.
+
+        Override this method with a lightweight probe (e.g., an importable
+        module or a binary in PATH) so that callers can skip constructing
+        providers whose dependencies are missing. ``is_available()`` remains
+        the authoritative check once an instance exists.
+
+        Returns:
+            False if the provider certainly cannot run, True otherwise
+        """
+        return True
+
     def get_unavailable_reason(self) -> str | None:
         """
         Get the reason why this provider is unavailable.
@@ -6,22 +6,437 @@ dependencies. It performs static analysis of tool definitions and
 configurations using Python heuristics.
 
 Implements 20 core heuristic rules (HEUR-001 through HEUR-020) as specified
-in the MVP requirements.
+in the MVP requirements, preceded by a definition validity check (HEUR-000).
+
+Findings are created with ``Finding.model_construct``: every field value is
+produced by this module with the correct type, so pydantic validation is
+skipped on the emit path.
 """
 
+import copy
+import hashlib
+import json
 import re
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from functools import partial
 from typing import Any
 
 from mcpreadiness.core.models import Finding, OperationalRiskCategory, Severity
+from mcpreadiness.providers._fastpath import count_non_generic, unvalidated_properties
 from mcpreadiness.providers.base import InspectionProvider
 
+# Enum members bound once; attribute access on an Enum class is slow
+_CAT_TIMEOUT = OperationalRiskCategory.MISSING_TIMEOUT_GUARD
+_CAT_RETRY = OperationalRiskCategory.UNSAFE_RETRY_LOOP
+_CAT_ERROR_SCHEMA = OperationalRiskCategory.MISSING_ERROR_SCHEMA
+_CAT_SCOPE = OperationalRiskCategory.OVERLOADED_TOOL_SCOPE
+_CAT_SILENT = OperationalRiskCategory.SILENT_FAILURE_PATH
+_CAT_OBSERVABILITY = OperationalRiskCategory.NO_OBSERVABILITY_HOOKS
+_CAT_NON_DETERMINISTIC = OperationalRiskCategory.NON_DETERMINISTIC_RESPONSE
+_SEV_HIGH = Severity.HIGH
+_SEV_MEDIUM = Severity.MEDIUM
+_SEV_LOW = Severity.LOW
+_SEV_INFO = Severity.INFO
+
+# Keyword tables used by the description checks, built once at import.
+# Tuples keep a deterministic order for evidence; frozensets are used where
+# only membership matters.
+_OVERLOAD_KEYWORDS: tuple[str, ...] = ("any", "all", "everything", "anything", "whatever")
+
+_ACTION_VERBS: tuple[str, ...] = (
+    "create", "read", "write", "update", "delete", "get", "set",
+    "fetch", "send", "post", "put", "patch", "remove", "add",
+    "list", "find", "search", "query", "execute", "run", "start",
+    "stop", "restart", "pause", "resume", "cancel", "retry",
+)
+
+_GENERIC_WORDS: frozenset[str] = frozenset({"tool", "utility", "helper", "function", "method"})
+
+# HEUR-010 matches whole words in a single regex pass per table
+_OVERLOAD_RE = re.compile(r"\b(?:" + "|".join(map(re.escape, _OVERLOAD_KEYWORDS)) + r")\b")
+_ACTION_VERB_RE = re.compile(r"\b(?:" + "|".join(map(re.escape, _ACTION_VERBS)) + r")\b")
+
+# HEUR-016 to HEUR-020 match keywords anywhere in the text (substrings)
+_RESOURCE_INDICATORS: tuple[str, ...] = (
+    "connection", "file", "stream", "socket", "handle",
+    "session", "lock", "transaction", "database", "network",
+)
+_CLEANUP_INDICATORS: tuple[str, ...] = (
+    "close", "cleanup", "release", "dispose", "free", "disconnect",
+)
+_STATE_CHANGING_VERBS: tuple[str, ...] = (
+    "create", "delete", "update", "modify", "remove", "insert",
+    "write", "post", "put", "patch", "drop", "truncate",
+)
+_IDEMPOTENCY_INDICATORS: tuple[str, ...] = (
+    "idempotent", "safe to retry", "can be retried",
+    "idempotency", "duplicate", "repeat",
+)
+_EXTERNAL_INDICATORS: tuple[str, ...] = (
+    "api", "service", "endpoint", "http", "rest", "request",
+    "external", "remote", "third-party", "cloud", "server",
+)
+# (pattern, meaning) pairs, checked in order
+_CIRCULAR_PATTERNS: tuple[tuple[str, str], ...] = (
+    ("calls itself", "self-referencing"),
+    ("recursive", "recursion"),
+    ("loop", "looping behavior"),
+    ("repeat until", "unbounded repetition"),
+)
+# (keyword, meaning) pairs, matched against the tool name and description
+_DANGEROUS_KEYWORDS: tuple[tuple[str, str], ...] = (
+    ("delete", "deletion operations"),
+    ("drop", "drop/destroy operations"),
+    ("truncate", "truncate operations"),
+    ("exec", "code execution"),
+    ("eval", "code evaluation"),
+    ("rm ", "file removal"),
+    ("remove", "removal operations"),
+    ("destroy", "destruction operations"),
+    ("purge", "purge operations"),
+    ("wipe", "wipe operations"),
+)
+
+# HEUR-CFG-003 matches these substrings in lower-cased environment variable
+# names. Lower-casing first is 2-3x faster than re.IGNORECASE and keeps
+# str.lower() semantics for non-ASCII names.
+_SENSITIVE_ENV_PATTERNS: tuple[str, ...] = ("key", "secret", "token", "password", "credential")
+_SENSITIVE_ENV_RE = re.compile("|".join(map(re.escape, _SENSITIVE_ENV_PATTERNS)))
+
+
+# Field names that indicate a given configuration is present
+_TIMEOUT_FIELDS: frozenset[str] = frozenset(
+    {"timeout", "timeoutMs", "timeout_ms", "timeoutSeconds"}
+)
+_TIMEOUT_CHECK_FIELDS: tuple[str, ...] = ("timeout", "timeoutMs", "timeout_ms")
+_RETRY_FIELDS: frozenset[str] = frozenset(
+    {"maxRetries", "retries", "max_retries", "retryCount", "retryLimit", "retry_limit"}
+)
+_RETRY_VALUE_FIELDS: tuple[str, ...] = ("maxRetries", "retries", "max_retries", "retryLimit")
+_BACKOFF_FIELDS: frozenset[str] = frozenset(
+    {
+        "backoff", "backoffMs", "exponentialBackoff", "backoffStrategy",
+        "retryDelay", "retryBackoff",
+    }
+)
+_ERROR_SCHEMA_FIELD_ORDER: tuple[str, ...] = (
+    "errorSchema", "error_schema", "errors", "errorResponse",
+)
+_ERROR_SCHEMA_FIELDS: frozenset[str] = frozenset(_ERROR_SCHEMA_FIELD_ORDER)
+_OUTPUT_SCHEMA_FIELDS: frozenset[str] = frozenset(
+    {"outputSchema", "output_schema", "responseSchema", "response_schema"}
+)
+_RATE_LIMIT_FIELDS: frozenset[str] = frozenset(
+    {"rateLimit", "rate_limit", "rateLimitPerMinute", "throttle", "maxCallsPerSecond"}
+)
+_VALIDATION_KEYWORDS: frozenset[str] = frozenset(
+    {
+        "pattern", "minLength", "maxLength", "minimum", "maximum",
+        "enum", "format", "minItems", "maxItems",
+    }
+)
+_AUTH_FIELDS: frozenset[str] = frozenset(
+    {"auth", "authentication", "credentials", "apiKey", "api_key", "token"}
+)
+_VERSION_FIELDS: frozenset[str] = frozenset(
+    {"version", "apiVersion", "api_version", "schemaVersion"}
+)
+_OBSERVABILITY_FIELDS: frozenset[str] = frozenset(
+    {
+        "observability", "logging", "metrics", "telemetry", "tracing",
+        "monitoring", "instrumentation", "logger",
+    }
+)
+
+
+class _KeywordScanner:
+    """
+    Find which of a fixed set of keywords occur in a text in one regex pass.
+
+    Each keyword owns one bit, and a scan returns the bitmask of the
+    keywords found, so checks test a whole keyword table with a single
+    ``&`` against the table's mask.
+
+    The pattern is a lookahead over every keyword, longest first, so it
+    reports the longest keyword starting at each position. Any shorter
+    keyword starting there is a prefix of that match and is added from a
+    precomputed table, giving the same result as a separate ``in`` test
+    per keyword. A leading one-character lookahead screens out positions
+    that no keyword can start at before the alternation is tried.
+    """
+
+    __slots__ = ("_pattern", "_bits", "_prefix_masks")
+
+    def __init__(self, keywords: Iterable[str]) -> None:
+        ordered = sorted(set(keywords), key=len, reverse=True)
+        first_chars = "".join(sorted({kw[0] for kw in ordered}))
+        self._pattern = re.compile(
+            f"(?=[{re.escape(first_chars)}])"
+            "(?=(" + "|".join(map(re.escape, ordered)) + "))"
+        )
+        self._bits = {kw: 1 << i for i, kw in enumerate(ordered)}
+        self._prefix_masks = {
+            kw: self.mask(other for other in ordered if kw.startswith(other))
+            for kw in ordered
+        }
+
+    def bit(self, keyword: str) -> int:
+        """Return the bit of a single keyword."""
+        return self._bits[keyword]
+
+    def mask(self, keywords: Iterable[str]) -> int:
+        """Return the combined bits of a group of keywords."""
+        mask = 0
+        for keyword in keywords:
+            mask |= self._bits[keyword]
+        return mask
+
+    def scan(self, text: str) -> int:
+        """Return the bitmask of the keywords that occur as substrings of text."""
+        prefix_masks = self._prefix_masks
+        found = 0
+        for kw in set(self._pattern.findall(text)):
+            found |= prefix_masks[kw]
+        return found
+
+    def scan_split(self, text: str, offset: int) -> tuple[int, int]:
+        """
+        Scan text once and return the bitmask of the keywords found anywhere
+        in it, and of the keywords found in ``text[offset:]``.
+        """
+        prefix_masks = self._prefix_masks
+        found = 0
+        found_tail = 0
+        for match in self._pattern.finditer(text):
+            matched = prefix_masks[match.group(1)]
+            found |= matched
+            if match.start() >= offset:
+                found_tail |= matched
+        return found, found_tail
+
+
+# One scanner over every substring table; HEUR-018 also covers the tool name
+_TEXT_SCANNER = _KeywordScanner(
+    _RESOURCE_INDICATORS
+    + _CLEANUP_INDICATORS
+    + _STATE_CHANGING_VERBS
+    + _IDEMPOTENCY_INDICATORS
+    + _EXTERNAL_INDICATORS
+    + tuple(pattern for pattern, _ in _CIRCULAR_PATTERNS)
+    + tuple(keyword for keyword, _ in _DANGEROUS_KEYWORDS)
+)
+_RESOURCE_MASK = _TEXT_SCANNER.mask(_RESOURCE_INDICATORS)
+_CLEANUP_MASK = _TEXT_SCANNER.mask(_CLEANUP_INDICATORS)
+_STATE_CHANGING_MASK = _TEXT_SCANNER.mask(_STATE_CHANGING_VERBS)
+_IDEMPOTENCY_MASK = _TEXT_SCANNER.mask(_IDEMPOTENCY_INDICATORS)
+_EXTERNAL_MASK = _TEXT_SCANNER.mask(_EXTERNAL_INDICATORS)
+_CIRCULAR_MASK = _TEXT_SCANNER.mask(pattern for pattern, _ in _CIRCULAR_PATTERNS)
+_DANGEROUS_MASK = _TEXT_SCANNER.mask(keyword for keyword, _ in _DANGEROUS_KEYWORDS)
+
+
+def _first_present(field: str, *sources: dict[str, Any]) -> Any:
+    """
+    Return the value of a field from the first source that defines it.
+
+    Unlike chaining ``.get()`` with ``or``, falsy values such as 0 or False
+    are returned as-is instead of falling through to the next source.
+    """
+    for source in sources:
+        if field in source:
+            return source[field]
+    return None
+
+
+def _copy_finding(finding: Finding) -> Finding:
+    """
+    Copy a finding so callers cannot mutate the cached one.
+
+    Only the evidence is deep-copied; every other field is immutable.
+    """
+    if finding.evidence:
+        return finding.model_copy(update={"evidence": copy.deepcopy(finding.evidence)})
+    return finding.model_copy()
+
+
+@dataclass(frozen=True, slots=True)
+class _ToolView:
+    """Values derived from a tool definition once and shared by every check."""
+
+    name: str
+    name_lower: str
+    location: str
+    td: dict[str, Any]
+    config: dict[str, Any]
+    description: str
+    desc_lower: str
+    # _TEXT_SCANNER bitmask of the keywords found in desc_lower
+    desc_mask: int
+    # _TEXT_SCANNER bitmask of the keywords found in the lower-cased
+    # "<name> <description>" text
+    text_mask: int
+    # "properties" and "required" of the inputSchema; empty without a schema
+    input_properties: Any
+    input_required: Any
+    retry_policy: dict[str, Any]
+
+    @classmethod
+    def from_definition(cls, tool_definition: dict[str, Any]) -> "_ToolView":
+        config = tool_definition.get("config") or {}
+        retry_policy = tool_definition.get("retryPolicy") or config.get("retryPolicy")
+        name = tool_definition.get("name", "unknown")
+        description = tool_definition.get("description") or ""
+        desc_lower = description.lower()
+        name_lower = name.lower()
+        # Name and description are scanned together; matches starting after
+        # the name prefix belong to the description alone
+        name_prefix = (name_lower if "name" in tool_definition else "") + " "
+        text_mask, desc_mask = _TEXT_SCANNER.scan_split(
+            name_prefix + desc_lower, len(name_prefix)
+        )
+        input_schema = tool_definition.get("inputSchema")
+        if not isinstance(input_schema, dict):
+            input_schema = {}
+        return cls(
+            name=name,
+            name_lower=name_lower,
+            # Finding locations all share this prefix; build it once per tool
+            location=f"tool.{name}",
+            td=tool_definition,
+            config=config,
+            description=description,
+            desc_lower=desc_lower,
+            desc_mask=desc_mask,
+            text_mask=text_mask,
+            input_properties=input_schema.get("properties", {}),
+            input_required=input_schema.get("required", []),
+            retry_policy=retry_policy if isinstance(retry_policy, dict) else {},
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class _PresenceRule:
+    """A rule that fires when none of its fields appear on a tool."""
+
+    rule_id: str
+    category: OperationalRiskCategory
+    severity: Severity
+    fields: frozenset[str]
+    title: str
+    # Formatted with the tool name
+    description: str
+    remediation: str
+    # Also accept the fields inside the tool's nested config
+    check_config: bool = False
+
+
+# Rules that only test whether a configuration field is present
+_PRESENCE_RULES: tuple[_PresenceRule, ...] = (
+    _PresenceRule(
+        rule_id="HEUR-001",
+        category=_CAT_TIMEOUT,
+        severity=_SEV_HIGH,
+        fields=_TIMEOUT_FIELDS,
+        title="No timeout configuration",
+        description=(
+            "Tool '{}' does not specify a timeout. "
+            "Operations may hang indefinitely if external services "
+            "become unresponsive."
+        ),
+        remediation=(
+            "Add a 'timeout' or 'timeoutMs' field with a reasonable "
+            "value (e.g., 30000 for 30 seconds)"
+        ),
+        check_config=True,
+    ),
+    _PresenceRule(
+        rule_id="HEUR-006",
+        category=_CAT_ERROR_SCHEMA,
+        severity=_SEV_MEDIUM,
+        fields=_ERROR_SCHEMA_FIELDS,
+        title="No error response schema",
+        description=(
+            "Tool '{}' does not define an error response schema. "
+            "Without structured error responses, agents cannot "
+            "programmatically handle failures."
+        ),
+        remediation=(
+            "Add an 'errorSchema' field defining the structure of "
+            "error responses with error codes and messages"
+        ),
+    ),
+    _PresenceRule(
+        rule_id="HEUR-008",
+        category=_CAT_ERROR_SCHEMA,
+        severity=_SEV_LOW,
+        fields=_OUTPUT_SCHEMA_FIELDS,
+        title="No output schema defined",
+        description=(
+            "Tool '{}' does not define an output schema. "
+            "Agents cannot reliably parse responses without knowing "
+            "the expected structure."
+        ),
+        remediation="Add an 'outputSchema' field defining the structure of successful responses",
+    ),
+    _PresenceRule(
+        rule_id="HEUR-013",
+        category=_CAT_RETRY,
+        severity=_SEV_LOW,
+        fields=_RATE_LIMIT_FIELDS,
+        title="No rate limit configuration",
+        description=(
+            "Tool '{}' does not specify rate limits. "
+            "Without rate limits, rapid repeated calls may overwhelm "
+            "external services or exhaust resources."
+        ),
+        remediation="Add a 'rateLimit' field specifying maximum calls per time period",
+        check_config=True,
+    ),
+    _PresenceRule(
+        rule_id="HEUR-014",
+        category=_CAT_OBSERVABILITY,
+        severity=_SEV_LOW,
+        fields=_VERSION_FIELDS,
+        title="No version information",
+        description=(
+            "Tool '{}' does not specify a version. "
+            "Versioning helps track changes and ensure compatibility "
+            "when tools evolve over time."
+        ),
+        remediation="Add a 'version' field (e.g., '1.0.0') following semantic versioning",
+    ),
+    _PresenceRule(
+        rule_id="HEUR-015",
+        category=_CAT_OBSERVABILITY,
+        severity=_SEV_LOW,
+        fields=_OBSERVABILITY_FIELDS,
+        title="No observability configuration",
+        description=(
+            "Tool '{}' does not configure observability hooks "
+            "(logging, metrics, tracing). Without observability, "
+            "debugging production issues becomes extremely difficult."
+        ),
+        remediation=(
+            "Add logging, metrics, or tracing configuration to enable "
+            "monitoring and debugging in production"
+        ),
+        check_config=True,
+    ),
+)
+
 
 class HeuristicProvider(InspectionProvider):
     """
     Heuristic-based inspection provider.
 
     Performs zero-dependency operational readiness checks on tool
-    definitions and configurations. Implements 20 core heuristic rules:
+    definitions and configurations. Implements 20 core heuristic rules,
+    preceded by a validity check:
+
+    Definition Validity (HEUR-000):
+    - Empty or invalid tool definition: not a mapping, or at most one
+      field. It is reported once and every other rule is skipped.
 
     Timeout Guards (HEUR-001, HEUR-002):
     - Missing timeout configuration
@@ -60,6 +475,9 @@ class HeuristicProvider(InspectionProvider):
     - Circular dependency risk
     """
 
+    # Number of distinct tool definitions whose findings are remembered
+    _CACHE_MAXSIZE = 4096
+
     def __init__(
         self,
         max_capabilities: int = 10,
@@ -75,6 +493,57 @@ class HeuristicProvider(InspectionProvider):
         self.max_capabilities = max_capabilities
         self.min_description_length = min_description_length
 
+        # Bound check methods run against every tool, in rule ID order. Each
+        # appends any findings into the shared list.
+        presence = {
+            rule.rule_id: partial(self._check_presence_rule, rule)
+            for rule in _PRESENCE_RULES
+        }
+        self._checks: tuple[Callable[[_ToolView, list[Finding]], None], ...] = (
+            # Timeout Guards
+            presence["HEUR-001"],
+            self._check_timeout_too_long,
+            # Retry Configuration
+            self._analyze_retries,
+            # Error Handling
+            presence["HEUR-006"],
+            self._check_error_schema_missing_code,
+            presence["HEUR-008"],
+            # Description Quality
+            self._check_vague_description,
+            self._check_too_many_capabilities,
+            # Input Validation
+            self._check_no_required_fields,
+            self._check_no_input_validation_hints,
+            # Operational Config
+            presence["HEUR-013"],
+            presence["HEUR-014"],
+            presence["HEUR-015"],
+            # Resource Management
+            self._check_resource_cleanup_not_documented,
+            self._check_no_idempotency_indication,
+            # Safety
+            self._check_dangerous_operation_keywords,
+            self._check_no_authentication_context,
+            self._check_circular_dependency_risk,
+        )
+
+        # Rules that only read the description can never fire without one,
+        # so tools with an empty description skip them (order is preserved)
+        description_only = {
+            self._check_resource_cleanup_not_documented,
+            self._check_no_idempotency_indication,
+            self._check_no_authentication_context,
+            self._check_too_many_capabilities,
+            self._check_circular_dependency_risk,
+        }
+        self._checks_without_description = tuple(
+            check for check in self._checks if check not in description_only
+        )
+
+        # Findings per canonical tool definition, in least recently used order
+        self._cache: OrderedDict[bytes, tuple[Finding, ...]] = OrderedDict()
+
     @property
     def name(self) -> str:
         return "heuristic"
@@ -86,56 +555,121 @@ class HeuristicProvider(InspectionProvider):
             "scope, error handling, and description quality (20 core rules)"
         )
 
-    async def analyze_tool(self, tool_definition: dict[str, Any]) -> list[Finding]:
+    async def analyze_tool(self, tool_definition: Any) -> list[Finding]:
         """
         Analyze a tool definition for operational readiness issues.
 
-        Runs all 20 heuristic rules against the tool definition.
+        Async entry point required by InspectionProvider; see
+        analyze_tool_sync.
+        """
+        return self.analyze_tool_sync(tool_definition)
+
+    async def analyze_tools(
+        self, tool_definitions: list[dict[str, Any]]
+    ) -> list[list[Finding]]:
+        """
+        Analyze several tool definitions in one call.
+
+        The rules are CPU-bound and never await, so the tools are analyzed
+        in a plain loop rather than scheduled as separate tasks.
 
         Args:
-            tool_definition: Dictionary containing the tool definition
+            tool_definitions: Tool definitions to analyze
 
         Returns:
-            List of findings from all applicable rules
+            One list of findings per tool definition, in input order
         """
-        findings: list[Finding] = []
-        tool_name = tool_definition.get("name", "unknown")
+        analyze = self.analyze_tool_sync
+        return [analyze(tool_definition) for tool_definition in tool_definitions]
 
-        # Timeout Guards
-        findings.extend(self._check_missing_timeout(tool_definition, tool_name))
-        findings.extend(self._check_timeout_too_long(tool_definition, tool_name))
-
-        # Retry Configuration
-        findings.extend(self._check_no_retry_limit(tool_definition, tool_name))
-        findings.extend(self._check_unlimited_retries(tool_definition, tool_name))
-        findings.extend(self._check_no_backoff_strategy(tool_definition, tool_name))
+    def analyze_tool_sync(self, tool_definition: Any) -> list[Finding]:
+        """
+        Analyze a tool definition without going through the event loop.
 
-        # Error Handling
-        findings.extend(self._check_missing_error_schema(tool_definition, tool_name))
-        findings.extend(self._check_error_schema_missing_code(tool_definition, tool_name))
-        findings.extend(self._check_no_output_schema(tool_definition, tool_name))
+        Runs all 20 heuristic rules against the tool definition, or only
+        reports HEUR-000 when it is not a mapping or has at most one field.
+        The rules do no I/O, so callers outside async code can use this
+        directly. Results are cached by the definition's content, so
+        registering the same tool many times only analyzes it once. Every
+        call returns its own copies of the findings.
 
-        # Description Quality
-        findings.extend(self._check_vague_description(tool_definition, tool_name))
-        findings.extend(self._check_too_many_capabilities(tool_definition, tool_name))
+        Args:
+            tool_definition: Dictionary (or other mapping) containing the
+                tool definition. Any other value is accepted and reported
+                as HEUR-000, so the parameter is not typed as a dict (a
+                compiled build would reject other values on entry).
 
-        # Input Validation
-        findings.extend(self._check_no_required_fields(tool_definition, tool_name))
-        findings.extend(self._check_no_input_validation_hints(tool_definition, tool_name))
+        Returns:
+            List of findings from all applicable rules
+        """
+        if not isinstance(tool_definition, dict):
+            if not isinstance(tool_definition, Mapping):
+                return [self._invalid_definition_finding(tool_definition)]
+            # Read-only mappings (e.g. MappingProxyType) are analyzed as a
+            # shallow copy so the rules and the JSON cache key see a dict
+            tool_definition = dict(tool_definition)
+        # A definition with at most one field would fail nearly every rule;
+        # report it once instead of running the whole cascade
+        if len(tool_definition) <= 1:
+            return [self._invalid_definition_finding(tool_definition)]
+
+        try:
+            canonical = json.dumps(tool_definition, sort_keys=True, separators=(",", ":"))
+        except (TypeError, ValueError):
+            # Not JSON-serializable, so there is no canonical form to cache on
+            return self._run_checks(tool_definition)
+        # Key on a fixed-size digest rather than the (possibly large) JSON text
+        key = hashlib.blake2b(canonical.encode(), digest_size=16).digest()
+
+        cache = self._cache
+        cached = cache.get(key)
+        if cached is not None:
+            cache.move_to_end(key)
+            return [_copy_finding(finding) for finding in cached]
+
+        findings = self._run_checks(tool_definition)
+        cache[key] = tuple(_copy_finding(finding) for finding in findings)
+        if len(cache) > self._CACHE_MAXSIZE:
+            cache.popitem(last=False)
+        return findings
 
-        # Operational Config
-        findings.extend(self._check_no_rate_limit(tool_definition, tool_name))
-        findings.extend(self._check_no_version(tool_definition, tool_name))
-        findings.extend(self._check_no_observability(tool_definition, tool_name))
+    def _invalid_definition_finding(self, tool_definition: Any) -> Finding:
+        """
+        HEUR-000: Build the finding for an empty or invalid tool definition.
+        """
+        name = "unknown"
+        if isinstance(tool_definition, dict):
+            name = tool_definition.get("name", name)
+
+        return Finding.model_construct(
+            category=_CAT_SILENT,
+            severity=_SEV_HIGH,
+            title="Empty or invalid tool definition",
+            description=(
+                f"Tool '{name}' is not a JSON object or defines at most one field. "
+                "There is not enough information to assess its operational readiness."
+            ),
+            location=f"tool.{name}",
+            evidence={
+                "type": type(tool_definition).__name__,
+                "fields": sorted(map(str, tool_definition)) if isinstance(tool_definition, dict) else [],
+            },
+            provider=self.name,
+            remediation=(
+                "Provide a complete tool definition with at least a name, description, "
+                "inputSchema, and timeout"
+            ),
+            rule_id="HEUR-000",
+        )
 
-        # Resource Management
-        findings.extend(self._check_resource_cleanup_not_documented(tool_definition, tool_name))
-        findings.extend(self._check_no_idempotency_indication(tool_definition, tool_name))
+    def _run_checks(self, tool_definition: dict[str, Any]) -> list[Finding]:
+        """Run every heuristic rule against a tool definition."""
+        findings: list[Finding] = []
+        view = _ToolView.from_definition(tool_definition)
 
-        # Safety
-        findings.extend(self._check_dangerous_operation_keywords(tool_definition, tool_name))
-        findings.extend(self._check_no_authentication_context(tool_definition, tool_name))
-        findings.extend(self._check_circular_dependency_risk(tool_definition, tool_name))
+        checks = self._checks if view.desc_lower else self._checks_without_description
+        for check in checks:
+            check(view, findings)
 
         return findings
 
@@ -143,6 +677,15 @@ class HeuristicProvider(InspectionProvider):
         """
         Analyze an MCP configuration for operational readiness issues.
 
+        Async entry point required by InspectionProvider; see
+        analyze_config_sync.
+        """
+        return self.analyze_config_sync(config)
+
+    def analyze_config_sync(self, config: dict[str, Any]) -> list[Finding]:
+        """
+        Analyze an MCP configuration without going through the event loop.
+
         Checks performed:
         - Server-level timeout configurations
         - Environment variable security (warnings for sensitive patterns)
@@ -154,9 +697,9 @@ class HeuristicProvider(InspectionProvider):
 
         if not mcp_servers:
             findings.append(
-                Finding(
-                    category=OperationalRiskCategory.SILENT_FAILURE_PATH,
-                    severity=Severity.INFO,
+                Finding.model_construct(
+                    category=_CAT_SILENT,
+                    severity=_SEV_INFO,
                     title="No MCP servers configured",
                     description="Configuration file contains no MCP server definitions",
                     location="mcpServers",
@@ -172,122 +715,100 @@ class HeuristicProvider(InspectionProvider):
         return findings
 
     # ===================================================================
-    # HEUR-001: Missing timeout (HIGH)
+    # HEUR-001, HEUR-006, HEUR-008, HEUR-013, HEUR-014, HEUR-015
     # ===================================================================
-    def _check_missing_timeout(
-        self, tool_def: dict[str, Any], tool_name: str
-    ) -> list[Finding]:
+    def _check_presence_rule(
+        self, rule: _PresenceRule, view: _ToolView, findings: list[Finding]
+    ) -> None:
         """
-        HEUR-001: Check for missing timeout configuration.
+        Flag a tool that is missing every field of a presence rule.
 
-        Timeout fields checked: timeout, timeoutMs, timeout_ms, timeoutSeconds
+        See _PRESENCE_RULES for the fields and wording of each rule.
         """
-        findings: list[Finding] = []
-
-        timeout_fields = ["timeout", "timeoutMs", "timeout_ms", "timeoutSeconds"]
-        has_timeout = any(field in tool_def for field in timeout_fields)
-
-        # Also check nested config
-        config = tool_def.get("config", {})
-        has_timeout = has_timeout or any(field in config for field in timeout_fields)
-
-        if not has_timeout:
-            findings.append(
-                Finding(
-                    category=OperationalRiskCategory.MISSING_TIMEOUT_GUARD,
-                    severity=Severity.HIGH,
-                    title="No timeout configuration",
-                    description=(
-                        f"Tool '{tool_name}' does not specify a timeout. "
-                        "Operations may hang indefinitely if external services "
-                        "become unresponsive."
-                    ),
-                    location=f"tool.{tool_name}",
-                    provider=self.name,
-                    remediation=(
-                        "Add a 'timeout' or 'timeoutMs' field with a reasonable "
-                        "value (e.g., 30000 for 30 seconds)"
-                    ),
-                    rule_id="HEUR-001",
-                )
+        if not rule.fields.isdisjoint(view.td):
+            return
+        if rule.check_config and not rule.fields.isdisjoint(view.config):
+            return
+
+        findings.append(
+            Finding.model_construct(
+                category=rule.category,
+                severity=rule.severity,
+                title=rule.title,
+                description=rule.description.format(view.name),
+                location=view.location,
+                provider=self.name,
+                remediation=rule.remediation,
+                rule_id=rule.rule_id,
             )
-
-        return findings
+        )
 
     # ===================================================================
     # HEUR-002: Timeout too long (MEDIUM)
     # ===================================================================
-    def _check_timeout_too_long(
-        self, tool_def: dict[str, Any], tool_name: str
-    ) -> list[Finding]:
+    def _check_timeout_too_long(self, view: _ToolView, findings: list[Finding]) -> None:
         """
         HEUR-002: Check if timeout is greater than 300000ms (5 minutes).
-        """
-        findings: list[Finding] = []
-
-        timeout_fields = ["timeout", "timeoutMs", "timeout_ms"]
-        config = tool_def.get("config", {})
 
-        for field in timeout_fields:
-            timeout_value = tool_def.get(field) or config.get(field)
-            if timeout_value is not None and timeout_value > 300000:
+        Only the first over-long timeout field is reported; non-numeric
+        values are skipped.
+        """
+        td, config = view.td, view.config
+        for field in _TIMEOUT_CHECK_FIELDS:
+            timeout_value = _first_present(field, td, config)
+            if isinstance(timeout_value, (int, float)) and timeout_value > 300000:
                 findings.append(
-                    Finding(
-                        category=OperationalRiskCategory.MISSING_TIMEOUT_GUARD,
-                        severity=Severity.MEDIUM,
+                    Finding.model_construct(
+                        category=_CAT_TIMEOUT,
+                        severity=_SEV_MEDIUM,
                         title="Timeout too long",
                         description=(
-                            f"Tool '{tool_name}' has {field}={timeout_value}ms "
+                            f"Tool '{view.name}' has {field}={timeout_value}ms "
                             "(over 5 minutes). Long timeouts can cause extended hangs "
                             "and poor user experience."
                         ),
-                        location=f"tool.{tool_name}.{field}",
+                        location=f"{view.location}.{field}",
                         evidence={"field": field, "value": timeout_value},
                         provider=self.name,
                         remediation="Consider reducing timeout to 30-60 seconds for better responsiveness",
                         rule_id="HEUR-002",
                     )
                 )
-
-        return findings
+                break  # Only the first over-long field is reported
 
     # ===================================================================
     # HEUR-003: No retry limit (MEDIUM)
+    # HEUR-004: Unlimited retries (HIGH)
+    # HEUR-005: No backoff strategy (LOW)
     # ===================================================================
-    def _check_no_retry_limit(
-        self, tool_def: dict[str, Any], tool_name: str
-    ) -> list[Finding]:
-        """
-        HEUR-003: Check for missing retry limit configuration.
+    def _analyze_retries(self, view: _ToolView, findings: list[Finding]) -> None:
         """
-        findings: list[Finding] = []
+        HEUR-003, HEUR-004, HEUR-005: Check retry configuration in one pass.
 
-        retry_fields = [
-            "maxRetries", "retries", "max_retries", "retryCount", 
-            "retryLimit", "retry_limit"
-        ]
-        has_retries = any(field in tool_def for field in retry_fields)
+        - HEUR-003: no retry limit field is present at all
+        - HEUR-004: a retry limit is unlimited (-1) or excessive (>10)
+        - HEUR-005: a retry limit is set but no backoff strategy is configured
+        """
+        td, config, retry_policy = view.td, view.config, view.retry_policy
 
-        config = tool_def.get("config", {})
-        has_retries = has_retries or any(field in config for field in retry_fields)
-        
-        # Also check for retryPolicy object
-        retry_policy = tool_def.get("retryPolicy") or config.get("retryPolicy")
-        if retry_policy and isinstance(retry_policy, dict):
-            has_retries = has_retries or any(field in retry_policy for field in retry_fields)
+        has_retry_field = (
+            not _RETRY_FIELDS.isdisjoint(td)
+            or not _RETRY_FIELDS.isdisjoint(config)
+            or not _RETRY_FIELDS.isdisjoint(retry_policy)
+        )
 
-        if not has_retries:
+        if not has_retry_field:
             findings.append(
-                Finding(
-                    category=OperationalRiskCategory.UNSAFE_RETRY_LOOP,
-                    severity=Severity.MEDIUM,
+                Finding.model_construct(
+                    category=_CAT_RETRY,
+                    severity=_SEV_MEDIUM,
                     title="No retry limit configured",
                     description=(
-                        f"Tool '{tool_name}' does not specify a retry limit. "
+                        f"Tool '{view.name}' does not specify a retry limit. "
                         "Without limits, retry logic may cause resource exhaustion "
                         "or infinite loops."
                     ),
-                    location=f"tool.{tool_name}",
+                    location=view.location,
                     provider=self.name,
                     remediation=(
                         "Add a 'maxRetries' or 'retryLimit' field with a "
@@ -296,192 +817,106 @@ class HeuristicProvider(InspectionProvider):
                     rule_id="HEUR-003",
                 )
             )
+            # None of the value fields can be set either, so HEUR-004/005 pass
+            return
 
-        return findings
-
-    # ===================================================================
-    # HEUR-004: Unlimited retries (HIGH)
-    # ===================================================================
-    def _check_unlimited_retries(
-        self, tool_def: dict[str, Any], tool_name: str
-    ) -> list[Finding]:
-        """
-        HEUR-004: Check for unlimited retries (maxRetries == -1 or > 10).
-        """
-        findings: list[Finding] = []
-
-        retry_fields = ["maxRetries", "retries", "max_retries", "retryLimit"]
-        config = tool_def.get("config", {})
-        retry_policy = tool_def.get("retryPolicy") or config.get("retryPolicy") or {}
-
-        for field in retry_fields:
-            retry_value = (
-                tool_def.get(field) 
-                or config.get(field) 
-                or (retry_policy.get(field) if isinstance(retry_policy, dict) else None)
-            )
-            
-            if retry_value is not None:
-                if retry_value == -1:
-                    findings.append(
-                        Finding(
-                            category=OperationalRiskCategory.UNSAFE_RETRY_LOOP,
-                            severity=Severity.HIGH,
-                            title="Unlimited retries configured",
-                            description=(
-                                f"Tool '{tool_name}' has {field}=-1, indicating unlimited retries. "
-                                "This can cause infinite loops and resource exhaustion."
-                            ),
-                            location=f"tool.{tool_name}.{field}",
-                            evidence={"field": field, "value": retry_value},
-                            provider=self.name,
-                            remediation="Set a finite retry limit (recommended: 3-5 retries)",
-                            rule_id="HEUR-004",
-                        )
-                    )
-                elif retry_value > 10:
-                    findings.append(
-                        Finding(
-                            category=OperationalRiskCategory.UNSAFE_RETRY_LOOP,
-                            severity=Severity.HIGH,
-                            title="Excessive retry limit",
-                            description=(
-                                f"Tool '{tool_name}' has {field}={retry_value}. "
-                                "Very high retry limits may cause extended delays during outages."
-                            ),
-                            location=f"tool.{tool_name}.{field}",
-                            evidence={"field": field, "value": retry_value},
-                            provider=self.name,
-                            remediation="Consider reducing retry limit to 3-5",
-                            rule_id="HEUR-004",
-                        )
-                    )
-
-        return findings
-
-    # ===================================================================
-    # HEUR-005: No backoff strategy (LOW)
-    # ===================================================================
-    def _check_no_backoff_strategy(
-        self, tool_def: dict[str, Any], tool_name: str
-    ) -> list[Finding]:
-        """
-        HEUR-005: Check for missing backoff strategy when retries are configured.
-        """
-        findings: list[Finding] = []
-
-        # First check if retries are configured
-        retry_fields = ["maxRetries", "retries", "max_retries", "retryLimit"]
-        config = tool_def.get("config", {})
-        retry_policy = tool_def.get("retryPolicy") or config.get("retryPolicy") or {}
-        
-        has_retries = any(
-            (tool_def.get(field) or config.get(field) or 
-             (retry_policy.get(field) if isinstance(retry_policy, dict) else None))
-            for field in retry_fields
-        )
+        has_retries = False
+        for field in _RETRY_VALUE_FIELDS:
+            retry_value = _first_present(field, td, config, retry_policy)
 
-        if has_retries:
-            # Check for backoff configuration
-            backoff_fields = [
-                "backoff", "backoffMs", "exponentialBackoff", "backoffStrategy",
-                "retryDelay", "retryBackoff"
-            ]
-            has_backoff = any(field in tool_def for field in backoff_fields)
-            has_backoff = has_backoff or any(field in config for field in backoff_fields)
-            has_backoff = has_backoff or (
-                isinstance(retry_policy, dict) and 
-                any(field in retry_policy for field in backoff_fields)
-            )
+            if retry_value is None:
+                continue
+            if retry_value:
+                has_retries = True
 
-            if not has_backoff:
+            if retry_value == -1:
                 findings.append(
-                    Finding(
-                        category=OperationalRiskCategory.UNSAFE_RETRY_LOOP,
-                        severity=Severity.LOW,
-                        title="No backoff strategy for retries",
+                    Finding.model_construct(
+                        category=_CAT_RETRY,
+                        severity=_SEV_HIGH,
+                        title="Unlimited retries configured",
                         description=(
-                            f"Tool '{tool_name}' has retry logic but no backoff strategy. "
-                            "Without backoff, rapid retries can overwhelm failing services."
+                            f"Tool '{view.name}' has {field}=-1, indicating unlimited retries. "
+                            "This can cause infinite loops and resource exhaustion."
                         ),
-                        location=f"tool.{tool_name}",
+                        location=f"{view.location}.{field}",
+                        evidence={"field": field, "value": retry_value},
                         provider=self.name,
-                        remediation=(
-                            "Add exponential backoff configuration (e.g., backoffMs, "
-                            "exponentialBackoff) to avoid thundering herd problems"
+                        remediation="Set a finite retry limit (recommended: 3-5 retries)",
+                        rule_id="HEUR-004",
+                    )
+                )
+            elif retry_value > 10:
+                findings.append(
+                    Finding.model_construct(
+                        category=_CAT_RETRY,
+                        severity=_SEV_HIGH,
+                        title="Excessive retry limit",
+                        description=(
+                            f"Tool '{view.name}' has {field}={retry_value}. "
+                            "Very high retry limits may cause extended delays during outages."
                         ),
-                        rule_id="HEUR-005",
+                        location=f"{view.location}.{field}",
+                        evidence={"field": field, "value": retry_value},
+                        provider=self.name,
+                        remediation="Consider reducing retry limit to 3-5",
+                        rule_id="HEUR-004",
                     )
                 )
 
-        return findings
-
-    # ===================================================================
-    # HEUR-006: Missing error schema (MEDIUM)
-    # ===================================================================
-    def _check_missing_error_schema(
-        self, tool_def: dict[str, Any], tool_name: str
-    ) -> list[Finding]:
-        """
-        HEUR-006: Check for missing error response schema.
-        """
-        findings: list[Finding] = []
-
-        error_schema_fields = ["errorSchema", "error_schema", "errors", "errorResponse"]
-        has_error_schema = any(field in tool_def for field in error_schema_fields)
-
-        if not has_error_schema:
+        # Backoff only matters once retries are actually configured
+        if (
+            has_retries
+            and _BACKOFF_FIELDS.isdisjoint(td)
+            and _BACKOFF_FIELDS.isdisjoint(config)
+            and _BACKOFF_FIELDS.isdisjoint(retry_policy)
+        ):
             findings.append(
-                Finding(
-                    category=OperationalRiskCategory.MISSING_ERROR_SCHEMA,
-                    severity=Severity.MEDIUM,
-                    title="No error response schema",
+                Finding.model_construct(
+                    category=_CAT_RETRY,
+                    severity=_SEV_LOW,
+                    title="No backoff strategy for retries",
                     description=(
-                        f"Tool '{tool_name}' does not define an error response schema. "
-                        "Without structured error responses, agents cannot "
-                        "programmatically handle failures."
+                        f"Tool '{view.name}' has retry logic but no backoff strategy. "
+                        "Without backoff, rapid retries can overwhelm failing services."
                     ),
-                    location=f"tool.{tool_name}",
+                    location=view.location,
                     provider=self.name,
                     remediation=(
-                        "Add an 'errorSchema' field defining the structure of "
-                        "error responses with error codes and messages"
+                        "Add exponential backoff configuration (e.g., backoffMs, "
+                        "exponentialBackoff) to avoid thundering herd problems"
                     ),
-                    rule_id="HEUR-006",
+                    rule_id="HEUR-005",
                 )
             )
 
-        return findings
-
     # ===================================================================
     # HEUR-007: Error schema missing code field (LOW)
     # ===================================================================
-    def _check_error_schema_missing_code(
-        self, tool_def: dict[str, Any], tool_name: str
-    ) -> list[Finding]:
+    def _check_error_schema_missing_code(self, view: _ToolView, findings: list[Finding]) -> None:
         """
         HEUR-007: Check if error schema exists but lacks a 'code' property.
         """
-        findings: list[Finding] = []
+        # Most tools define no error schema at all; skip the ordered scan
+        if _ERROR_SCHEMA_FIELDS.isdisjoint(view.td):
+            return
 
-        error_schema_fields = ["errorSchema", "error_schema", "errors", "errorResponse"]
-        
-        for field in error_schema_fields:
-            error_schema = tool_def.get(field)
+        for field in _ERROR_SCHEMA_FIELD_ORDER:
+            error_schema = view.td.get(field)
             if error_schema and isinstance(error_schema, dict):
-                properties = error_schema.get("properties", {})
+                properties = error_schema.get("properties", ())
                 if "code" not in properties and "errorCode" not in properties:
                     findings.append(
-                        Finding(
-                            category=OperationalRiskCategory.MISSING_ERROR_SCHEMA,
-                            severity=Severity.LOW,
+                        Finding.model_construct(
+                            category=_CAT_ERROR_SCHEMA,
+                            severity=_SEV_LOW,
                             title="Error schema missing error code field",
                             description=(
-                                f"Tool '{tool_name}' has an error schema but it doesn't "
+                                f"Tool '{view.name}' has an error schema but it doesn't "
                                 "include a 'code' or 'errorCode' property. Error codes are "
                                 "essential for programmatic error handling."
                             ),
-                            location=f"tool.{tool_name}.{field}.properties",
+                            location=f"{view.location}.{field}.properties",
                             provider=self.name,
                             remediation="Add a 'code' property to the error schema (e.g., string enum of error codes)",
                             rule_id="HEUR-007",
@@ -489,68 +924,28 @@ class HeuristicProvider(InspectionProvider):
                     )
                 break  # Only check the first error schema found
 
-        return findings
-
-    # ===================================================================
-    # HEUR-008: No output schema (LOW)
-    # ===================================================================
-    def _check_no_output_schema(
-        self, tool_def: dict[str, Any], tool_name: str
-    ) -> list[Finding]:
-        """
-        HEUR-008: Check for missing output/response schema.
-        """
-        findings: list[Finding] = []
-
-        output_schema_fields = ["outputSchema", "output_schema", "responseSchema", "response_schema"]
-        has_output_schema = any(field in tool_def for field in output_schema_fields)
-
-        if not has_output_schema:
-            findings.append(
-                Finding(
-                    category=OperationalRiskCategory.MISSING_ERROR_SCHEMA,
-                    severity=Severity.LOW,
-                    title="No output schema defined",
-                    description=(
-                        f"Tool '{tool_name}' does not define an output schema. "
-                        "Agents cannot reliably parse responses without knowing "
-                        "the expected structure."
-                    ),
-                    location=f"tool.{tool_name}",
-                    provider=self.name,
-                    remediation="Add an 'outputSchema' field defining the structure of successful responses",
-                    rule_id="HEUR-008",
-                )
-            )
-
-        return findings
-
     # ===================================================================
     # HEUR-009: Vague description (MEDIUM)
     # ===================================================================
-    def _check_vague_description(
-        self, tool_def: dict[str, Any], tool_name: str
-    ) -> list[Finding]:
+    def _check_vague_description(self, view: _ToolView, findings: list[Finding]) -> None:
         """
         HEUR-009: Check if description is missing or too short (<20 chars)
         or contains only generic words.
         """
-        findings: list[Finding] = []
-
-        description = tool_def.get("description", "")
+        description = view.description
 
         if not description:
             findings.append(
-                Finding(
-                    category=OperationalRiskCategory.OVERLOADED_TOOL_SCOPE,
-                    severity=Severity.MEDIUM,
+                Finding.model_construct(
+                    category=_CAT_SCOPE,
+                    severity=_SEV_MEDIUM,
                     title="Missing description",
                     description=(
-                        f"Tool '{tool_name}' has no description. "
+                        f"Tool '{view.name}' has no description. "
                         "Agents rely on descriptions to understand tool capabilities "
                         "and select the appropriate tool for tasks."
                     ),
-                    location=f"tool.{tool_name}.description",
+                    location=f"{view.location}.description",
                     provider=self.name,
                     remediation="Add a clear, detailed description explaining what the tool does",
                     rule_id="HEUR-009",
@@ -558,16 +953,16 @@ class HeuristicProvider(InspectionProvider):
             )
         elif len(description) < 20:
             findings.append(
-                Finding(
-                    category=OperationalRiskCategory.OVERLOADED_TOOL_SCOPE,
-                    severity=Severity.MEDIUM,
+                Finding.model_construct(
+                    category=_CAT_SCOPE,
+                    severity=_SEV_MEDIUM,
                     title="Vague description",
                     description=(
-                        f"Tool '{tool_name}' has a very short description "
+                        f"Tool '{view.name}' has a very short description "
                         f"({len(description)} characters, minimum 20 recommended). "
                         "Brief descriptions may not provide enough context for agents."
                     ),
-                    location=f"tool.{tool_name}.description",
+                    location=f"{view.location}.description",
                     evidence={"length": len(description), "minimum": 20},
                     provider=self.name,
                     remediation="Expand the description to explain the tool's purpose, inputs, and expected outputs",
@@ -576,59 +971,54 @@ class HeuristicProvider(InspectionProvider):
             )
         else:
             # Check for generic-only words
-            generic_words = ["tool", "utility", "helper", "function", "method"]
-            words = description.lower().split()
-            non_generic_words = [w for w in words if w not in generic_words]
-            
-            if len(non_generic_words) < 3:
+            words = view.desc_lower.split()
+            non_generic_count = count_non_generic(words, _GENERIC_WORDS, 3)
+
+            if non_generic_count < 3:
                 findings.append(
-                    Finding(
-                        category=OperationalRiskCategory.OVERLOADED_TOOL_SCOPE,
-                        severity=Severity.MEDIUM,
+                    Finding.model_construct(
+                        category=_CAT_SCOPE,
+                        severity=_SEV_MEDIUM,
                         title="Generic description",
                         description=(
-                            f"Tool '{tool_name}' description contains only generic words. "
+                            f"Tool '{view.name}' description contains only generic words. "
                             "Add specific details about what the tool does."
                         ),
-                        location=f"tool.{tool_name}.description",
+                        location=f"{view.location}.description",
                         provider=self.name,
                         remediation="Replace generic terms with specific details about functionality",
                         rule_id="HEUR-009",
                     )
                 )
 
-        return findings
-
     # ===================================================================
     # HEUR-010: Too many capabilities (HIGH)
     # ===================================================================
-    def _check_too_many_capabilities(
-        self, tool_def: dict[str, Any], tool_name: str
-    ) -> list[Finding]:
+    def _check_too_many_capabilities(self, view: _ToolView, findings: list[Finding]) -> None:
         """
         HEUR-010: Check if description mentions >5 verbs or words like
         "any", "all", "everything".
         """
-        findings: list[Finding] = []
-
-        description = tool_def.get("description", "").lower()
+        description = view.desc_lower
+        if not description:
+            # HEUR-009 already reports the missing description
+            return
 
-        # Check for overload keywords
-        overload_keywords = ["any", "all", "everything", "anything", "whatever"]
-        found_overload_keywords = [kw for kw in overload_keywords if kw in description]
+        # Check for overload keywords (deduplicated, in order of appearance)
+        found_overload_keywords = list(dict.fromkeys(_OVERLOAD_RE.findall(description)))
 
         if found_overload_keywords:
             findings.append(
-                Finding(
-                    category=OperationalRiskCategory.OVERLOADED_TOOL_SCOPE,
-                    severity=Severity.HIGH,
+                Finding.model_construct(
+                    category=_CAT_SCOPE,
+                    severity=_SEV_HIGH,
                     title="Overloaded tool scope indicated",
                     description=(
-                        f"Tool '{tool_name}' description contains scope-overload keywords: "
+                        f"Tool '{view.name}' description contains scope-overload keywords: "
                         f"{', '.join(found_overload_keywords)}. Tools that do 'everything' "
                         "are difficult to test, maintain, and use reliably."
                     ),
-                    location=f"tool.{tool_name}.description",
+                    location=f"{view.location}.description",
                     evidence={"keywords": found_overload_keywords},
                     provider=self.name,
                     remediation=(
@@ -640,27 +1030,20 @@ class HeuristicProvider(InspectionProvider):
             )
 
         # Check for too many action verbs
-        action_verbs = [
-            "create", "read", "write", "update", "delete", "get", "set",
-            "fetch", "send", "post", "put", "patch", "remove", "add",
-            "list", "find", "search", "query", "execute", "run", "start",
-            "stop", "restart", "pause", "resume", "cancel", "retry"
-        ]
-        
-        found_verbs = [verb for verb in action_verbs if verb in description]
-        
+        found_verbs = list(dict.fromkeys(_ACTION_VERB_RE.findall(description)))
+
         if len(found_verbs) > 5:
             findings.append(
-                Finding(
-                    category=OperationalRiskCategory.OVERLOADED_TOOL_SCOPE,
-                    severity=Severity.HIGH,
+                Finding.model_construct(
+                    category=_CAT_SCOPE,
+                    severity=_SEV_HIGH,
                     title="Too many capabilities",
                     description=(
-                        f"Tool '{tool_name}' description mentions {len(found_verbs)} action verbs "
+                        f"Tool '{view.name}' description mentions {len(found_verbs)} action verbs "
                         f"(found: {', '.join(found_verbs[:5])}...). Tools with many capabilities "
                         "are harder to test, secure, and maintain."
                     ),
-                    location=f"tool.{tool_name}.description",
+                    location=f"{view.location}.description",
                     evidence={"verb_count": len(found_verbs), "verbs": found_verbs},
                     provider=self.name,
                     remediation="Consider splitting into multiple focused tools with specific responsibilities",
@@ -668,261 +1051,107 @@ class HeuristicProvider(InspectionProvider):
                 )
             )
 
-        return findings
-
     # ===================================================================
     # HEUR-011: No required fields (LOW)
     # ===================================================================
-    def _check_no_required_fields(
-        self, tool_def: dict[str, Any], tool_name: str
-    ) -> list[Finding]:
+    def _check_no_required_fields(self, view: _ToolView, findings: list[Finding]) -> None:
         """
         HEUR-011: Check if inputSchema exists but no 'required' array is defined.
         """
-        findings: list[Finding] = []
-
-        input_schema = tool_def.get("inputSchema")
-
-        if input_schema and isinstance(input_schema, dict):
-            properties = input_schema.get("properties", {})
-            required = input_schema.get("required", [])
-            
-            # Only flag if there are properties but no required fields
-            if properties and not required:
-                findings.append(
-                    Finding(
-                        category=OperationalRiskCategory.SILENT_FAILURE_PATH,
-                        severity=Severity.LOW,
-                        title="No required fields specified",
-                        description=(
-                            f"Tool '{tool_name}' has an input schema with {len(properties)} properties "
-                            "but doesn't specify which fields are required. This may lead to "
-                            "missing input errors at runtime."
-                        ),
-                        location=f"tool.{tool_name}.inputSchema.required",
-                        evidence={"property_count": len(properties)},
-                        provider=self.name,
-                        remediation="Add a 'required' array listing mandatory input fields",
-                        rule_id="HEUR-011",
-                    )
-                )
-
-        return findings
-
-    # ===================================================================
-    # HEUR-012: No input validation hints (INFO)
-    # ===================================================================
-    def _check_no_input_validation_hints(
-        self, tool_def: dict[str, Any], tool_name: str
-    ) -> list[Finding]:
-        """
-        HEUR-012: Check if inputSchema properties lack validation keywords
-        like 'pattern', 'minLength', 'enum', 'minimum', 'maximum', etc.
-        """
-        findings: list[Finding] = []
-
-        input_schema = tool_def.get("inputSchema")
-
-        if input_schema and isinstance(input_schema, dict):
-            properties = input_schema.get("properties", {})
-            
-            if properties:
-                validation_keywords = [
-                    "pattern", "minLength", "maxLength", "minimum", "maximum",
-                    "enum", "format", "minItems", "maxItems"
-                ]
-                
-                properties_without_validation = []
-                for prop_name, prop_def in properties.items():
-                    if isinstance(prop_def, dict):
-                        has_validation = any(kw in prop_def for kw in validation_keywords)
-                        if not has_validation:
-                            properties_without_validation.append(prop_name)
-                
-                if properties_without_validation and len(properties_without_validation) >= len(properties) * 0.5:
-                    findings.append(
-                        Finding(
-                            category=OperationalRiskCategory.SILENT_FAILURE_PATH,
-                            severity=Severity.INFO,
-                            title="Missing input validation hints",
-                            description=(
-                                f"Tool '{tool_name}' input schema has {len(properties_without_validation)} "
-                                f"properties (out of {len(properties)}) without validation constraints "
-                                "(pattern, minLength, enum, etc.). This may allow invalid inputs."
-                            ),
-                            location=f"tool.{tool_name}.inputSchema.properties",
-                            evidence={
-                                "properties_without_validation": properties_without_validation[:5],
-                                "total_properties": len(properties)
-                            },
-                            provider=self.name,
-                            remediation=(
-                                "Add validation constraints to input properties (e.g., pattern for strings, "
-                                "minimum/maximum for numbers, enum for limited choices)"
-                            ),
-                            rule_id="HEUR-012",
-                        )
-                    )
-
-        return findings
-
-    # ===================================================================
-    # HEUR-013: No rate limit (LOW)
-    # ===================================================================
-    def _check_no_rate_limit(
-        self, tool_def: dict[str, Any], tool_name: str
-    ) -> list[Finding]:
-        """
-        HEUR-013: Check for missing rate limit configuration.
-        """
-        findings: list[Finding] = []
-
-        rate_limit_fields = [
-            "rateLimit", "rate_limit", "rateLimitPerMinute", 
-            "throttle", "maxCallsPerSecond"
-        ]
-        has_rate_limit = any(field in tool_def for field in rate_limit_fields)
-
-        config = tool_def.get("config", {})
-        has_rate_limit = has_rate_limit or any(field in config for field in rate_limit_fields)
+        properties = view.input_properties
 
-        if not has_rate_limit:
+        # Only flag if there are properties but no required fields
+        if properties and not view.input_required:
             findings.append(
-                Finding(
-                    category=OperationalRiskCategory.UNSAFE_RETRY_LOOP,
-                    severity=Severity.LOW,
-                    title="No rate limit configuration",
+                Finding.model_construct(
+                    category=_CAT_SILENT,
+                    severity=_SEV_LOW,
+                    title="No required fields specified",
                     description=(
-                        f"Tool '{tool_name}' does not specify rate limits. "
-                        "Without rate limits, rapid repeated calls may overwhelm "
-                        "external services or exhaust resources."
+                        f"Tool '{view.name}' has an input schema with {len(properties)} properties "
+                        "but doesn't specify which fields are required. This may lead to "
+                        "missing input errors at runtime."
                     ),
-                    location=f"tool.{tool_name}",
+                    location=f"{view.location}.inputSchema.required",
+                    evidence={"property_count": len(properties)},
                     provider=self.name,
-                    remediation="Add a 'rateLimit' field specifying maximum calls per time period",
-                    rule_id="HEUR-013",
+                    remediation="Add a 'required' array listing mandatory input fields",
+                    rule_id="HEUR-011",
                 )
             )
 
-        return findings
-
     # ===================================================================
-    # HEUR-014: No version (LOW)
+    # HEUR-012: No input validation hints (INFO)
     # ===================================================================
-    def _check_no_version(
-        self, tool_def: dict[str, Any], tool_name: str
-    ) -> list[Finding]:
+    def _check_no_input_validation_hints(self, view: _ToolView, findings: list[Finding]) -> None:
         """
-        HEUR-014: Check for missing version information.
+        HEUR-012: Check if inputSchema properties lack validation keywords
+        like 'pattern', 'minLength', 'enum', 'minimum', 'maximum', etc.
         """
-        findings: list[Finding] = []
+        properties = view.input_properties
 
-        version_fields = ["version", "apiVersion", "api_version", "schemaVersion"]
-        has_version = any(field in tool_def for field in version_fields)
-
-        if not has_version:
-            findings.append(
-                Finding(
-                    category=OperationalRiskCategory.NO_OBSERVABILITY_HOOKS,
-                    severity=Severity.LOW,
-                    title="No version information",
-                    description=(
-                        f"Tool '{tool_name}' does not specify a version. "
-                        "Versioning helps track changes and ensure compatibility "
-                        "when tools evolve over time."
-                    ),
-                    location=f"tool.{tool_name}",
-                    provider=self.name,
-                    remediation="Add a 'version' field (e.g., '1.0.0') following semantic versioning",
-                    rule_id="HEUR-014",
-                )
+        if properties:
+            # Only the first few names are kept for the evidence
+            unvalidated_count, unvalidated_names = unvalidated_properties(
+                properties, _VALIDATION_KEYWORDS, 5
             )
 
-        return findings
-
-    # ===================================================================
-    # HEUR-015: No observability config (LOW)
-    # ===================================================================
-    def _check_no_observability(
-        self, tool_def: dict[str, Any], tool_name: str
-    ) -> list[Finding]:
-        """
-        HEUR-015: Check for missing observability/monitoring configuration.
-        """
-        findings: list[Finding] = []
-
-        observability_fields = [
-            "observability", "logging", "metrics", "telemetry", "tracing",
-            "monitoring", "instrumentation", "logger"
-        ]
-        has_observability = any(field in tool_def for field in observability_fields)
-
-        config = tool_def.get("config", {})
-        has_observability = has_observability or any(
-            field in config for field in observability_fields
-        )
-
-        if not has_observability:
-            findings.append(
-                Finding(
-                    category=OperationalRiskCategory.NO_OBSERVABILITY_HOOKS,
-                    severity=Severity.LOW,
-                    title="No observability configuration",
-                    description=(
-                        f"Tool '{tool_name}' does not configure observability hooks "
-                        "(logging, metrics, tracing). Without observability, "
-                        "debugging production issues becomes extremely difficult."
-                    ),
-                    location=f"tool.{tool_name}",
-                    provider=self.name,
-                    remediation=(
-                        "Add logging, metrics, or tracing configuration to enable "
-                        "monitoring and debugging in production"
-                    ),
-                    rule_id="HEUR-015",
+            if unvalidated_count and unvalidated_count >= len(properties) * 0.5:
+                findings.append(
+                    Finding.model_construct(
+                        category=_CAT_SILENT,
+                        severity=_SEV_INFO,
+                        title="Missing input validation hints",
+                        description=(
+                            f"Tool '{view.name}' input schema has {unvalidated_count} "
+                            f"properties (out of {len(properties)}) without validation constraints "
+                            "(pattern, minLength, enum, etc.). This may allow invalid inputs."
+                        ),
+                        location=f"{view.location}.inputSchema.properties",
+                        evidence={
+                            "properties_without_validation": unvalidated_names,
+                            "total_properties": len(properties)
+                        },
+                        provider=self.name,
+                        remediation=(
+                            "Add validation constraints to input properties (e.g., pattern for strings, "
+                            "minimum/maximum for numbers, enum for limited choices)"
+                        ),
+                        rule_id="HEUR-012",
+                    )
                 )
-            )
-
-        return findings
 
     # ===================================================================
     # HEUR-016: Resource cleanup not documented (MEDIUM)
     # ===================================================================
-    def _check_resource_cleanup_not_documented(
-        self, tool_def: dict[str, Any], tool_name: str
-    ) -> list[Finding]:
+    def _check_resource_cleanup_not_documented(self, view: _ToolView, findings: list[Finding]) -> None:
         """
         HEUR-016: Check if description mentions resources but not cleanup.
         """
-        findings: list[Finding] = []
-
-        description = tool_def.get("description", "").lower()
+        found = view.desc_mask
 
         # Check if tool appears to use resources that need cleanup
-        resource_indicators = [
-            "connection", "file", "stream", "socket", "handle",
-            "session", "lock", "transaction", "database", "network"
-        ]
-        uses_resources = any(indicator in description for indicator in resource_indicators)
+        uses_resources = found & _RESOURCE_MASK
 
         if uses_resources:
             # Check if cleanup is documented
-            cleanup_indicators = ["close", "cleanup", "release", "dispose", "free", "disconnect"]
-            has_cleanup_doc = any(indicator in description for indicator in cleanup_indicators)
+            has_cleanup_doc = found & _CLEANUP_MASK
 
             if not has_cleanup_doc:
-                found_resources = [ind for ind in resource_indicators if ind in description]
+                found_resources = [
+                    ind for ind in _RESOURCE_INDICATORS if found & _TEXT_SCANNER.bit(ind)
+                ]
                 findings.append(
-                    Finding(
-                        category=OperationalRiskCategory.SILENT_FAILURE_PATH,
-                        severity=Severity.MEDIUM,
+                    Finding.model_construct(
+                        category=_CAT_SILENT,
+                        severity=_SEV_MEDIUM,
                         title="Resource cleanup not documented",
                         description=(
-                            f"Tool '{tool_name}' appears to use resources ({', '.join(found_resources[:3])}) "
+                            f"Tool '{view.name}' appears to use resources ({', '.join(found_resources[:3])}) "
                             "but doesn't document cleanup procedures. "
                             "Resource leaks can cause production instability."
                         ),
-                        location=f"tool.{tool_name}.description",
+                        location=f"{view.location}.description",
                         evidence={"resources": found_resources},
                         provider=self.name,
                         remediation=(
@@ -933,49 +1162,35 @@ class HeuristicProvider(InspectionProvider):
                     )
                 )
 
-        return findings
-
     # ===================================================================
     # HEUR-017: No idempotency indication (INFO)
     # ===================================================================
-    def _check_no_idempotency_indication(
-        self, tool_def: dict[str, Any], tool_name: str
-    ) -> list[Finding]:
+    def _check_no_idempotency_indication(self, view: _ToolView, findings: list[Finding]) -> None:
         """
         HEUR-017: Check if tool appears to modify state but doesn't
         document idempotency.
         """
-        findings: list[Finding] = []
-
-        description = tool_def.get("description", "").lower()
+        found = view.desc_mask
 
         # Check if tool appears to be state-changing
-        state_changing_verbs = [
-            "create", "delete", "update", "modify", "remove", "insert",
-            "write", "post", "put", "patch", "drop", "truncate"
-        ]
-        is_state_changing = any(verb in description for verb in state_changing_verbs)
+        is_state_changing = found & _STATE_CHANGING_MASK
 
         if is_state_changing:
             # Check if idempotency is documented
-            idempotency_indicators = [
-                "idempotent", "safe to retry", "can be retried", 
-                "idempotency", "duplicate", "repeat"
-            ]
-            has_idempotency_doc = any(indicator in description for indicator in idempotency_indicators)
+            has_idempotency_doc = found & _IDEMPOTENCY_MASK
 
             if not has_idempotency_doc:
                 findings.append(
-                    Finding(
-                        category=OperationalRiskCategory.NON_DETERMINISTIC_RESPONSE,
-                        severity=Severity.INFO,
+                    Finding.model_construct(
+                        category=_CAT_NON_DETERMINISTIC,
+                        severity=_SEV_INFO,
                         title="No idempotency indication",
                         description=(
-                            f"Tool '{tool_name}' appears to perform state-changing operations "
+                            f"Tool '{view.name}' appears to perform state-changing operations "
                             "but doesn't indicate whether it's idempotent. This is important "
                             "for retry logic - non-idempotent operations may cause duplicates."
                         ),
-                        location=f"tool.{tool_name}.description",
+                        location=f"{view.location}.description",
                         provider=self.name,
                         remediation=(
                             "Document whether the operation is idempotent and safe to retry. "
@@ -985,54 +1200,36 @@ class HeuristicProvider(InspectionProvider):
                     )
                 )
 
-        return findings
-
     # ===================================================================
     # HEUR-018: Dangerous operation keywords (HIGH)
     # ===================================================================
-    def _check_dangerous_operation_keywords(
-        self, tool_def: dict[str, Any], tool_name: str
-    ) -> list[Finding]:
+    def _check_dangerous_operation_keywords(self, view: _ToolView, findings: list[Finding]) -> None:
         """
         HEUR-018: Check for dangerous keywords in name/description like
         'delete', 'drop', 'truncate', 'exec', 'eval'.
         """
-        findings: list[Finding] = []
-
-        name = tool_def.get("name", "").lower()
-        description = tool_def.get("description", "").lower()
-        combined = f"{name} {description}"
-
-        dangerous_keywords = [
-            ("delete", "deletion operations"),
-            ("drop", "drop/destroy operations"),
-            ("truncate", "truncate operations"),
-            ("exec", "code execution"),
-            ("eval", "code evaluation"),
-            ("rm ", "file removal"),
-            ("remove", "removal operations"),
-            ("destroy", "destruction operations"),
-            ("purge", "purge operations"),
-            ("wipe", "wipe operations"),
+        found = view.text_mask
+        if not found & _DANGEROUS_MASK:
+            return
+
+        found_dangerous = [
+            (keyword, meaning)
+            for keyword, meaning in _DANGEROUS_KEYWORDS
+            if found & _TEXT_SCANNER.bit(keyword)
         ]
 
-        found_dangerous = []
-        for keyword, meaning in dangerous_keywords:
-            if keyword in combined:
-                found_dangerous.append((keyword, meaning))
-
         if found_dangerous:
             findings.append(
-                Finding(
-                    category=OperationalRiskCategory.OVERLOADED_TOOL_SCOPE,
-                    severity=Severity.HIGH,
+                Finding.model_construct(
+                    category=_CAT_SCOPE,
+                    severity=_SEV_HIGH,
                     title="Dangerous operation keywords detected",
                     description=(
-                        f"Tool '{tool_name}' contains dangerous operation keywords: "
+                        f"Tool '{view.name}' contains dangerous operation keywords: "
                         f"{', '.join(k for k, _ in found_dangerous)}. "
                         "Tools performing destructive operations require extra safeguards."
                     ),
-                    location=f"tool.{tool_name}",
+                    location=view.location,
                     evidence={"keywords": [k for k, m in found_dangerous]},
                     provider=self.name,
                     remediation=(
@@ -1043,46 +1240,33 @@ class HeuristicProvider(InspectionProvider):
                 )
             )
 
-        return findings
-
     # ===================================================================
     # HEUR-019: No authentication context (INFO)
     # ===================================================================
-    def _check_no_authentication_context(
-        self, tool_def: dict[str, Any], tool_name: str
-    ) -> list[Finding]:
+    def _check_no_authentication_context(self, view: _ToolView, findings: list[Finding]) -> None:
         """
         HEUR-019: Check if tool accesses external resources but has no
         authentication configuration documented.
         """
-        findings: list[Finding] = []
-
-        auth_fields = ["auth", "authentication", "credentials", "apiKey", "api_key", "token"]
-        has_auth = any(field in tool_def for field in auth_fields)
+        has_auth = not _AUTH_FIELDS.isdisjoint(view.td)
 
-        config = tool_def.get("config", {})
-        has_auth = has_auth or any(field in config for field in auth_fields)
+        has_auth = has_auth or not _AUTH_FIELDS.isdisjoint(view.config)
 
         # Check if description mentions external services
-        description = tool_def.get("description", "").lower()
-        external_indicators = [
-            "api", "service", "endpoint", "http", "rest", "request",
-            "external", "remote", "third-party", "cloud", "server"
-        ]
-        mentions_external = any(indicator in description for indicator in external_indicators)
+        mentions_external = view.desc_mask & _EXTERNAL_MASK
 
         if mentions_external and not has_auth:
             findings.append(
-                Finding(
-                    category=OperationalRiskCategory.SILENT_FAILURE_PATH,
-                    severity=Severity.INFO,
+                Finding.model_construct(
+                    category=_CAT_SILENT,
+                    severity=_SEV_INFO,
                     title="No authentication context documented",
                     description=(
-                        f"Tool '{tool_name}' appears to interact with external services "
+                        f"Tool '{view.name}' appears to interact with external services "
                         "but does not document authentication requirements. This may lead "
                         "to authorization failures at runtime."
                     ),
-                    location=f"tool.{tool_name}",
+                    location=view.location,
                     provider=self.name,
                     remediation=(
                         "Document authentication requirements (e.g., 'requires API_KEY environment variable', "
@@ -1092,33 +1276,27 @@ class HeuristicProvider(InspectionProvider):
                 )
             )
 
-        return findings
-
     # ===================================================================
     # HEUR-020: Circular dependency risk (MEDIUM)
     # ===================================================================
-    def _check_circular_dependency_risk(
-        self, tool_def: dict[str, Any], tool_name: str
-    ) -> list[Finding]:
+    def _check_circular_dependency_risk(self, view: _ToolView, findings: list[Finding]) -> None:
         """
         HEUR-020: Check if tool references itself or common circular patterns.
         """
-        findings: list[Finding] = []
-
-        description = tool_def.get("description", "").lower()
+        description = view.desc_lower
         
         # Check if tool name appears in its own description (potential self-reference)
-        if tool_name and tool_name.lower() in description:
+        if view.name and view.name_lower in description:
             findings.append(
-                Finding(
-                    category=OperationalRiskCategory.UNSAFE_RETRY_LOOP,
-                    severity=Severity.MEDIUM,
+                Finding.model_construct(
+                    category=_CAT_RETRY,
+                    severity=_SEV_MEDIUM,
                     title="Potential circular dependency",
                     description=(
-                        f"Tool '{tool_name}' references itself in its description. "
+                        f"Tool '{view.name}' references itself in its description. "
                         "Self-referencing tools can cause infinite loops in agent workflows."
                     ),
-                    location=f"tool.{tool_name}.description",
+                    location=f"{view.location}.description",
                     provider=self.name,
                     remediation=(
                         "Ensure the tool does not call itself recursively. "
@@ -1129,37 +1307,35 @@ class HeuristicProvider(InspectionProvider):
             )
         
         # Check for circular dependency patterns
-        circular_patterns = [
-            ("calls itself", "self-referencing"),
-            ("recursive", "recursion"),
-            ("loop", "looping behavior"),
-            ("repeat until", "unbounded repetition"),
-        ]
-        
-        for pattern, meaning in circular_patterns:
-            if pattern in description:
-                findings.append(
-                    Finding(
-                        category=OperationalRiskCategory.UNSAFE_RETRY_LOOP,
-                        severity=Severity.MEDIUM,
-                        title="Circular dependency risk pattern detected",
-                        description=(
-                            f"Tool '{tool_name}' description mentions {meaning}. "
-                            "Ensure proper termination conditions to avoid infinite loops."
-                        ),
-                        location=f"tool.{tool_name}.description",
-                        evidence={"pattern": pattern, "meaning": meaning},
-                        provider=self.name,
-                        remediation=(
-                            "Add explicit termination conditions, maximum iteration counts, "
-                            "or depth limits to prevent infinite loops"
-                        ),
-                        rule_id="HEUR-020",
-                    )
-                )
-                break  # Only report once
-
-        return findings
+        found = view.desc_mask
+        if not found & _CIRCULAR_MASK:
+            return
+
+        # The mask test guarantees a match; only the first one is reported
+        pattern, meaning = next(
+            (pattern, meaning)
+            for pattern, meaning in _CIRCULAR_PATTERNS
+            if found & _TEXT_SCANNER.bit(pattern)
+        )
+        findings.append(
+            Finding.model_construct(
+                category=_CAT_RETRY,
+                severity=_SEV_MEDIUM,
+                title="Circular dependency risk pattern detected",
+                description=(
+                    f"Tool '{view.name}' description mentions {meaning}. "
+                    "Ensure proper termination conditions to avoid infinite loops."
+                ),
+                location=f"{view.location}.description",
+                evidence={"pattern": pattern, "meaning": meaning},
+                provider=self.name,
+                remediation=(
+                    "Add explicit termination conditions, maximum iteration counts, "
+                    "or depth limits to prevent infinite loops"
+                ),
+                rule_id="HEUR-020",
+            )
+        )
 
     # ===================================================================
     # Config Checking (Server-level)
@@ -1173,9 +1349,9 @@ class HeuristicProvider(InspectionProvider):
         # Check for missing command
         if "command" not in server_config:
             findings.append(
-                Finding(
-                    category=OperationalRiskCategory.SILENT_FAILURE_PATH,
-                    severity=Severity.HIGH,
+                Finding.model_construct(
+                    category=_CAT_SILENT,
+                    severity=_SEV_HIGH,
                     title="Missing server command",
                     description=(
                         f"Server '{server_name}' does not specify a command. "
@@ -1189,13 +1365,13 @@ class HeuristicProvider(InspectionProvider):
 
         # Check for env vars that might contain secrets
         env_vars = server_config.get("env", {})
-        sensitive_patterns = ["key", "secret", "token", "password", "credential"]
+        is_sensitive = _SENSITIVE_ENV_RE.search
         for env_name in env_vars:
-            if any(p in env_name.lower() for p in sensitive_patterns):
+            if is_sensitive(env_name.lower()):
                 findings.append(
-                    Finding(
-                        category=OperationalRiskCategory.NO_OBSERVABILITY_HOOKS,
-                        severity=Severity.INFO,
+                    Finding.model_construct(
+                        category=_CAT_OBSERVABILITY,
+                        severity=_SEV_INFO,
                         title="Sensitive environment variable",
                         description=(
                             f"Server '{server_name}' has environment variable "
@@ -1211,9 +1387,9 @@ class HeuristicProvider(InspectionProvider):
         # Check for timeout at server level
         if "timeout" not in server_config:
             findings.append(
-                Finding(
-                    category=OperationalRiskCategory.MISSING_TIMEOUT_GUARD,
-                    severity=Severity.MEDIUM,
+                Finding.model_construct(
+                    category=_CAT_TIMEOUT,
+                    severity=_SEV_MEDIUM,
                     title="No server timeout",
                     description=(
                         f"Server '{server_name}' does not specify a timeout. "
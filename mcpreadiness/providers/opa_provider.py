@@ -83,6 +83,11 @@ class OpaProvider(InspectionProvider):
         self._opa_path = shutil.which(self.opa_binary)
         return self._opa_path is not None
 
+    @classmethod
+    def is_available_static(cls) -> bool:
+        """Check if the default OPA binary is available in PATH."""
+        return shutil.which("opa") is not None
+
     def get_unavailable_reason(self) -> str | None:
         if not self.is_available():
             return (
@@ -95,6 +95,11 @@ class YaraProvider(InspectionProvider):
         """Check if yara-python is installed."""
         return _yara_available
 
+    @classmethod
+    def is_available_static(cls) -> bool:
+        """Check if yara-python is installed."""
+        return _yara_available
+
     def get_unavailable_reason(self) -> str | None:
         if not _yara_available:
             return f"yara-python not installed: {_yara_import_error}"
@@ -2,6 +2,6 @@
 
 from mcpreadiness.reports.json_report import render_json
 from mcpreadiness.reports.markdown_report import render_markdown
-from mcpreadiness.reports.sarif import render_sarif
+from mcpreadiness.reports.sarif import render_sarif, render_sarif_stream
 
-__all__ = ["render_json", "render_markdown", "render_sarif"]
+__all__ = ["render_json", "render_markdown", "render_sarif", "render_sarif_stream"]
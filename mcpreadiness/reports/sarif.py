@@ -7,13 +7,31 @@ and other SARIF-compatible tools.
 SARIF Specification: https://docs.oasis-open.org/sarif/sarif/v2.1.0/sarif-v2.1.0.html
 """
 
+import io
 import json
-from typing import Any
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
+from itertools import islice
+from typing import Any, TextIO
 
 from mcpreadiness import __version__
 from mcpreadiness.core.models import Finding, ScanResult, Severity
 from mcpreadiness.core.taxonomy import CATEGORY_DESCRIPTIONS, OperationalRiskCategory
 
+# Try to import orjson, a much faster serializer for large reports
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+SARIF_SCHEMA = "https://raw.githubusercontent.com/oasis-tcs/sarif-spec/main/sarif-2.1/schema/sarif-schema-2.1.0.json"
+
+# Base of every artifact URI relative to the scanned sources
+SARIF_SRCROOT = "%SRCROOT%"
+
+# Results serialized per call when streaming
+_RESULT_BATCH_SIZE = 64
+
 # SARIF severity levels
 SARIF_LEVELS = {
     Severity.CRITICAL: "error",
@@ -32,47 +50,128 @@ SARIF_SECURITY_SEVERITY = {
     Severity.INFO: "low",
 }
 
+# Both maps cover every severity, so results index them directly
+assert set(SARIF_LEVELS) == set(SARIF_SECURITY_SEVERITY) == set(Severity)
 
-def render_sarif(result: ScanResult) -> str:
+
+def render_sarif(
+    result: ScanResult, dedup: bool = True, logical_locations: bool = False
+) -> str:
     """
     Render a scan result as SARIF 2.1.0 JSON.
 
     Args:
         result: The scan result to render
+        dedup: Skip findings repeating the category, rule ID, location and
+            title of an earlier finding
+        logical_locations: Also emit each finding's location (e.g.
+            "tool.name.field") as a SARIF logical location
 
     Returns:
         SARIF JSON string
     """
-    sarif = _build_sarif(result)
+    buffer = io.StringIO()
+    render_sarif_stream(result, buffer, dedup=dedup, logical_locations=logical_locations)
+    return buffer.getvalue()
+
+
+def render_sarif_stream(
+    result: ScanResult,
+    fp: TextIO,
+    dedup: bool = True,
+    logical_locations: bool = False,
+) -> None:
+    """
+    Write a scan result as SARIF 2.1.0 JSON to a text file object.
+
+    Results are built, serialized and written in fixed-size batches, so the
+    full document never has to be held in memory. The output is the same
+    text that render_sarif returns.
+
+    Args:
+        result: The scan result to render
+        fp: Writable text file object
+        dedup: Skip findings repeating the category, rule ID, location and
+            title of an earlier finding
+        logical_locations: Also emit each finding's location (e.g.
+            "tool.name.field") as a SARIF logical location
+    """
+    write = fp.write
+    write("{\n")
+    write(f'  "$schema": {_dumps(SARIF_SCHEMA)},\n')
+    write('  "version": "2.1.0",\n')
+    write('  "runs": [\n    {\n')
+    write(f'      "tool": {_indented(_build_tool(), 6)},\n')
+
+    findings = _unique_findings(result.findings) if dedup else result.findings
+    target = result.target
+    numbered = enumerate(findings)
+    first = True
+    while batch := [
+        _build_result(f, i, target, logical_locations)
+        for i, f in islice(numbered, _RESULT_BATCH_SIZE)
+    ]:
+        write('      "results": [\n' if first else ",\n")
+        # Serialized as "[\n  {...},\n  {...}\n]"; keep the elements and
+        # move them from two to eight spaces deep
+        write("      " + _dumps(batch)[2:-2].replace("\n", "\n      "))
+        first = False
+    write('      "results": [],\n' if first else "\n      ],\n")
+
+    write(f'      "invocations": {_indented(_build_invocations(result), 6)},\n')
+    write(f'      "properties": {_indented(_build_run_properties(result), 6)}\n')
+    write("    }\n  ]\n}")
+
+
+def _dumps(sarif: Any) -> str:
+    """
+    Serialize a SARIF value with two-space indentation.
+
+    Uses orjson when it is installed, falling back to the standard library
+    for documents orjson rejects (e.g. evidence with non-string keys).
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(sarif, option=orjson.OPT_INDENT_2).decode()
+        except TypeError:
+            pass
     return json.dumps(sarif, indent=2)
 
 
-def _build_sarif(result: ScanResult) -> dict[str, Any]:
-    """Build the SARIF document structure."""
-    return {
-        "$schema": "https://raw.githubusercontent.com/oasis-tcs/sarif-spec/main/sarif-2.1/schema/sarif-schema-2.1.0.json",
-        "version": "2.1.0",
-        "runs": [_build_run(result)],
-    }
+def _indented(value: Any, level: int) -> str:
+    """Serialize a value nested ``level`` spaces deep in the document."""
+    # JSON strings cannot contain raw newlines, so every newline is layout
+    return _dumps(value).replace("\n", "\n" + " " * level)
 
 
-def _build_run(result: ScanResult) -> dict[str, Any]:
-    """Build a SARIF run object."""
+def _unique_findings(findings: Iterable[Finding]) -> Iterator[Finding]:
+    """Yield findings, skipping repeats of an already seen fingerprint."""
+    seen: set[tuple[Any, ...]] = set()
+    for finding in findings:
+        key = (finding.category, finding.rule_id, finding.location, finding.title)
+        if key in seen:
+            continue
+        seen.add(key)
+        yield finding
+
+
+def _build_invocations(result: ScanResult) -> list[dict[str, Any]]:
+    """Build the SARIF invocations of a run."""
+    return [
+        {
+            "executionSuccessful": True,
+            "endTimeUtc": result.timestamp.isoformat() + "Z",
+        }
+    ]
+
+
+def _build_run_properties(result: ScanResult) -> dict[str, Any]:
+    """Build the properties bag of a SARIF run."""
     return {
-        "tool": _build_tool(),
-        "results": [_build_result(f, i, result.target) for i, f in enumerate(result.findings)],
-        "invocations": [
-            {
-                "executionSuccessful": True,
-                "endTimeUtc": result.timestamp.isoformat() + "Z",
-            }
-        ],
-        "properties": {
-            "readinessScore": result.readiness_score,
-            "isProductionReady": result.is_production_ready,
-            "target": result.target,
-            "providersUsed": result.providers_used,
-        },
+        "readinessScore": result.readiness_score,
+        "isProductionReady": result.is_production_ready,
+        "target": result.target,
+        "providersUsed": result.providers_used,
     }
 
 
@@ -83,7 +182,7 @@ def _build_tool() -> dict[str, Any]:
             "name": "mcp-readiness-scanner",
             "version": __version__,
             "informationUri": "https://github.com/mcp-readiness/scanner",
-            "rules": _build_rules(),
+            "rules": _RULES,
             "properties": {
                 "tags": ["mcp", "operational-readiness", "agentic-ai"],
             },
@@ -126,6 +225,52 @@ def _build_rules() -> list[dict[str, Any]]:
     return rules
 
 
+# The rule table only depends on the taxonomy, so it is built once at import
+_RULES: list[dict[str, Any]] = _build_rules()
+
+# Position of each category's rule in _RULES, for the results' ruleIndex
+_RULE_INDEX: dict[OperationalRiskCategory, int] = {
+    category: index for index, category in enumerate(OperationalRiskCategory)
+}
+
+# Fixed result fields per (category, severity): ruleId, ruleIndex, level and
+# the severity property, so results need no per-finding enum lookups
+_RESULT_FIELDS: dict[tuple[OperationalRiskCategory, Severity], tuple[str, int, str, str]] = {
+    (category, severity): (
+        category.value,
+        _RULE_INDEX[category],
+        SARIF_LEVELS[severity],
+        severity.value,
+    )
+    for category in OperationalRiskCategory
+    for severity in Severity
+}
+
+
+@lru_cache(maxsize=1024)
+def _parse_location(location: str) -> tuple[str, int | None, int | None]:
+    """
+    Split a location string into its logical name and line range.
+
+    Findings of one tool or file share locations, so parses are cached.
+    """
+    # Check for line number format: "path:123" or "path:10-20"
+    if ":" in location and location.split(":")[-1].replace("-", "").isdigit():
+        logical_name, line_part = location.rsplit(":", 1)
+
+        if "-" in line_part:
+            # Range format: "10-20"
+            start, end = line_part.split("-", 1)
+            return logical_name, int(start), int(end)
+
+        # Single line: "123"
+        line = int(line_part)
+        return logical_name, line, line
+
+    # No line numbers, just a logical location
+    return location, None, None
+
+
 def _parse_location_region(location: str | None) -> tuple[str | None, dict[str, int] | None]:
     """
     Parse a location string to extract file/path and line/region information.
@@ -142,39 +287,22 @@ def _parse_location_region(location: str | None) -> tuple[str | None, dict[str,
     if not location:
         return None, None
 
-    # Check for line number format: "path:123" or "path:10-20"
-    if ":" in location and location.split(":")[-1].replace("-", "").isdigit():
-        parts = location.rsplit(":", 1)
-        logical_name = parts[0]
-        line_part = parts[1]
-
-        if "-" in line_part:
-            # Range format: "10-20"
-            start, end = line_part.split("-", 1)
-            region = {
-                "startLine": int(start),
-                "endLine": int(end),
-            }
-        else:
-            # Single line: "123"
-            line = int(line_part)
-            region = {
-                "startLine": line,
-                "endLine": line,
-            }
-        return logical_name, region
-
-    # No line numbers, just a logical location
-    return location, None
+    logical_name, start, end = _parse_location(location)
+    if start is None or end is None:
+        return logical_name, None
+    return logical_name, {"startLine": start, "endLine": end}
 
 
-def _build_location(finding_location: str | None, target: str | None) -> dict[str, Any] | None:
+def _build_location(
+    finding_location: str | None, target: str | None, logical_locations: bool = False
+) -> dict[str, Any] | None:
     """
-    Build a SARIF location object with physical and logical locations.
+    Build a SARIF location object with a physical and optional logical location.
 
     Args:
         finding_location: The location string from the finding
         target: The scan target (file path)
+        logical_locations: Add the finding location as a logical location
 
     Returns:
         SARIF location object or None
@@ -190,7 +318,7 @@ def _build_location(finding_location: str | None, target: str | None) -> dict[st
     physical_location: dict[str, Any] = {
         "artifactLocation": {
             "uri": artifact_uri,
-            "uriBaseId": "%SRCROOT%",
+            "uriBaseId": SARIF_SRCROOT,
         },
     }
 
@@ -200,8 +328,8 @@ def _build_location(finding_location: str | None, target: str | None) -> dict[st
 
     location["physicalLocation"] = physical_location
 
-    # Build logical location if we have a logical name
-    if logical_name and logical_name != artifact_uri:
+    # Build logical location if requested and it adds to the artifact URI
+    if logical_locations and logical_name and logical_name != artifact_uri:
         location["logicalLocations"] = [
             {
                 "name": logical_name,
@@ -213,7 +341,12 @@ def _build_location(finding_location: str | None, target: str | None) -> dict[st
     return location
 
 
-def _build_result(finding: Finding, index: int, target: str | None = None) -> dict[str, Any]:
+def _build_result(
+    finding: Finding,
+    index: int,
+    target: str | None = None,
+    logical_locations: bool = False,
+) -> dict[str, Any]:
     """
     Build a SARIF result object from a finding.
 
@@ -221,18 +354,20 @@ def _build_result(finding: Finding, index: int, target: str | None = None) -> di
         finding: The finding to convert
         index: Index of this finding in the results list
         target: The scan target (file path) for the result
+        logical_locations: Add the finding location as a logical location
     """
+    rule_id, rule_index, level, severity = _RESULT_FIELDS[finding.category, finding.severity]
     result: dict[str, Any] = {
-        "ruleId": finding.category.value,
-        "ruleIndex": list(OperationalRiskCategory).index(finding.category),
-        "level": SARIF_LEVELS.get(finding.severity, "warning"),
+        "ruleId": rule_id,
+        "ruleIndex": rule_index,
+        "level": level,
         "message": {
             "text": f"{finding.title}: {finding.description}",
         },
         "locations": [],
         "properties": {
             "provider": finding.provider,
-            "severity": finding.severity.value,
+            "severity": severity,
         },
     }
 
@@ -242,7 +377,7 @@ def _build_result(finding: Finding, index: int, target: str | None = None) -> di
 
     # Add location if present
     if finding.location or target:
-        location = _build_location(finding.location, target)
+        location = _build_location(finding.location, target, logical_locations)
         if location:
             result["locations"].append(location)
 
@@ -5,6 +5,8 @@ This configuration file ensures pytest-asyncio is properly loaded
 and configured for async test support.
 """
 
+import asyncio
+
 import pytest
 
 # Explicitly configure pytest-asyncio
@@ -15,3 +17,10 @@ pytest_plugins = ("pytest_asyncio",)
 def anyio_backend():
     """Use asyncio as the async backend."""
     return "asyncio"
+
+
+@pytest.fixture(scope="session")
+def runner():
+    """One asyncio runner for the session, for sync tests that drive coroutines."""
+    with asyncio.Runner() as r:
+        yield r
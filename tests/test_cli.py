@@ -0,0 +1,54 @@
+"""Tests for the command line interface."""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from mcpreadiness import cli
+
+TOOL = {"name": "test_tool", "description": "A test tool", "timeout": 30000}
+
+
+@pytest.fixture
+def tool_file(tmp_path, monkeypatch):
+    # Run from an empty directory so no project config file is picked up
+    monkeypatch.chdir(tmp_path)
+    path = tmp_path / "tool.json"
+    path.write_text(json.dumps(TOOL), encoding="utf-8")
+    return path
+
+
+def _scan_sarif(tool_file, output):
+    args = ["scan-tool", "--tool", str(tool_file), "--format", "sarif", "--output", str(output)]
+    return CliRunner().invoke(cli.cli, args)
+
+
+def test_scan_tool_sarif_output(tool_file, tmp_path):
+    output = tmp_path / "report.sarif"
+
+    result = _scan_sarif(tool_file, output)
+
+    # A non-zero exit reports high or critical findings; the scan itself must not raise
+    assert result.exception is None or isinstance(result.exception, SystemExit), result.output
+    sarif = json.loads(output.read_text(encoding="utf-8"))
+    assert sarif["version"] == "2.1.0"
+    assert sarif["runs"][0]["results"]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["report.sarif", "tool.json"]
+
+
+def test_scan_tool_sarif_output_failure_keeps_no_partial_file(tool_file, tmp_path, monkeypatch):
+    output = tmp_path / "report.sarif"
+    output.write_text("previous report", encoding="utf-8")
+
+    def failing_stream(result, fp):
+        fp.write('{\n  "version": ')
+        raise RuntimeError("render failed")
+
+    monkeypatch.setattr(cli, "render_sarif_stream", failing_stream)
+
+    result = _scan_sarif(tool_file, output)
+
+    assert isinstance(result.exception, RuntimeError)
+    assert output.read_text(encoding="utf-8") == "previous report"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["report.sarif", "tool.json"]
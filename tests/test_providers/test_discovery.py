@@ -0,0 +1,114 @@
+"""Tests for provider discovery and its caches."""
+
+import importlib
+
+import pytest
+
+import mcpreadiness.providers as providers
+from mcpreadiness.providers import HeuristicProvider
+from mcpreadiness.providers.opa_provider import OpaProvider
+
+
+class _Plugin(HeuristicProvider):
+    """A custom provider registered through a fake entry point."""
+
+
+class _EntryPoint:
+    def __init__(self, name, obj):
+        self.name = name
+        self._obj = obj
+
+    def load(self):
+        return self._obj
+
+
+@pytest.fixture
+def select_calls(monkeypatch):
+    """Replace entry point selection with one plugin and record each lookup."""
+    calls = []
+
+    def select_eps(group):
+        calls.append(group)
+        return [_EntryPoint("plugin", _Plugin)]
+
+    monkeypatch.setattr(providers, "_select_eps", select_eps)
+    providers._reset_provider_cache()
+    yield calls
+    providers._reset_provider_cache()
+
+
+def test_discovery_is_cached(select_calls):
+    assert providers.discover_custom_providers() == {"plugin": _Plugin}
+    assert providers.discover_custom_providers() == {"plugin": _Plugin}
+
+    assert select_calls == ["mcp_readiness.providers"]
+
+
+def test_reset_rediscovers(select_calls):
+    providers.discover_custom_providers()
+    providers._reset_provider_cache()
+    providers.discover_custom_providers()
+
+    assert len(select_calls) == 2
+
+
+def test_discovery_returns_a_copy(select_calls):
+    discovered = providers.discover_custom_providers()
+    discovered.pop("plugin")
+    discovered["other"] = _Plugin
+
+    assert providers.discover_custom_providers() == {"plugin": _Plugin}
+
+
+def test_non_provider_entry_point_is_skipped(monkeypatch, select_calls):
+    monkeypatch.setattr(providers, "_select_eps", lambda group: [_EntryPoint("bad", object)])
+
+    with pytest.warns(UserWarning, match="not a subclass"):
+        assert providers.discover_custom_providers() == {}
+
+
+def test_missing_optional_dependency_resolves_to_none(monkeypatch):
+    import_module = importlib.import_module
+
+    def fail_yara(name):
+        if name == "mcpreadiness.providers.yara_provider":
+            raise ImportError("No module named 'yara'")
+        return import_module(name)
+
+    # Recorded so the original attribute is restored after the test
+    monkeypatch.setitem(vars(providers), "YaraProvider", None)
+    del vars(providers)["YaraProvider"]
+    monkeypatch.setattr(importlib, "import_module", fail_yara)
+
+    assert providers.YaraProvider is None
+
+
+@pytest.mark.parametrize("available", (False, True), ids=("unavailable", "available"))
+def test_default_providers_gated_on_static_check(monkeypatch, select_calls, available):
+    def is_available(self):
+        assert available, "instance check must not run when the static check fails"
+        return True
+
+    monkeypatch.setattr(OpaProvider, "is_available_static", classmethod(lambda cls: available))
+    monkeypatch.setattr(OpaProvider, "is_available", is_available)
+
+    default_types = [type(p) for p in providers.get_default_providers()]
+
+    assert (OpaProvider in default_types) is available
+
+
+def test_reset_clears_all_provider_classes(monkeypatch, select_calls):
+    assert OpaProvider in providers.get_all_provider_classes()
+
+    import_module = importlib.import_module
+
+    def fail_opa(name):
+        if name == "mcpreadiness.providers.opa_provider":
+            raise ImportError("OPA provider unavailable")
+        return import_module(name)
+
+    monkeypatch.setitem(vars(providers), "OpaProvider", OpaProvider)
+    monkeypatch.setattr(importlib, "import_module", fail_opa)
+    providers._reset_provider_cache()
+
+    assert OpaProvider not in providers.get_all_provider_classes()
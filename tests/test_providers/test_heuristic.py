@@ -1,13 +1,198 @@
 """Tests for the heuristic provider."""
 
+from collections.abc import Mapping
+from types import MappingProxyType
+
 import pytest
 
-from mcpreadiness.core.models import OperationalRiskCategory, Severity
+from mcpreadiness.core.models import Finding, OperationalRiskCategory, Severity
 from mcpreadiness.providers.heuristic_provider import HeuristicProvider
 
+# Under pytest-xdist --dist loadgroup, keep this module on one worker so
+# the module-scoped provider is only built once
+pytestmark = pytest.mark.xdist_group("heuristic")
+
+# Enum members used by the assertions, bound once at import
+_MTG = OperationalRiskCategory.MISSING_TIMEOUT_GUARD
+_UNSAFE_RETRY = OperationalRiskCategory.UNSAFE_RETRY_LOOP
+_OVERLOAD = OperationalRiskCategory.OVERLOADED_TOOL_SCOPE
+_MES = OperationalRiskCategory.MISSING_ERROR_SCHEMA
+_HIGH = Severity.HIGH
+_HIGH_OR_CRIT = frozenset({Severity.HIGH, Severity.CRITICAL})
+
+# Read-only tool templates; tests copy them with overrides
+BASE_TOOL = MappingProxyType({"name": "test_tool", "description": "A test tool", "timeout": 30000})
+BAD_NO_TIMEOUT = MappingProxyType({"name": "test_tool", "description": "A test tool"})
+
+# The provider never mutates its input, so immutable tuples are passed as-is
+_EXCESSIVE_CAPS = tuple(f"cap_{i}" for i in range(15))
+
+# Golden table: every distinct tool input once, by name
+TOOL_INPUTS = {
+    "base": BASE_TOOL,
+    "no_timeout": BAD_NO_TIMEOUT,
+    "no_description": {"name": "test_tool", "timeout": 30000},
+    "short_description": {**BASE_TOOL, "description": "Short"},
+    "api_caller": {
+        "name": "api_caller",
+        "description": "Calls an external REST API endpoint to fetch data",
+        "timeout": 30000,
+    },
+    "blocker": {
+        "name": "blocker",
+        "description": "This operation blocks until the file is ready",
+        "timeout": 30000,
+    },
+    "updater": {
+        "name": "updater",
+        "description": "Updates the user record in the database",
+        "timeout": 30000,
+    },
+    "deprecated": {
+        "name": "old_tool",
+        "description": "This tool is deprecated and will be removed soon",
+        "timeout": 30000,
+    },
+    "experimental": {
+        "name": "new_tool",
+        "description": "This is an experimental feature",
+        "timeout": 30000,
+    },
+    "connector": {
+        "name": "connector",
+        "description": "Opens a database connection to fetch records",
+        "timeout": 30000,
+    },
+    "bulk_deleter": {
+        "name": "bulk_deleter",
+        "description": "Performs batch delete operations on matching records",
+        "timeout": 30000,
+    },
+    "api_tool": {
+        "name": "api_tool",
+        "description": "Makes HTTP requests to an external API service",
+        "timeout": 30000,
+    },
+}
+
+
+def _golden(input_name, expected, *, title=(), severity=None, id):
+    """Build a golden case; ``title`` lists words of which the title must contain one."""
+    return pytest.param(input_name, expected, title, severity, id=id)
+
+
+def _assert_finding(findings, expected, title=(), severity=None):
+    """Assert one finding has the expected rule ID or category, title word and severity."""
+    assert any(
+        expected in (f.rule_id, f.category)
+        and (not title or any(word in f.title.lower() for word in title))
+        and (severity is None or f.severity == severity)
+        for f in findings
+    ), f"no {getattr(expected, 'value', expected)} finding; found {[f.rule_id for f in findings]}"
+
+
+# Golden cases: a TOOL_INPUTS name and the rule ID or category one of its findings must have
+GOLDEN_CASES = (
+    _golden("no_timeout", _MTG, severity=_HIGH, id="missing_timeout"),
+    _golden("base", _UNSAFE_RETRY, id="missing_retry_limit"),
+    _golden("base", _MES, id="missing_error_schema"),
+    _golden("no_description", "HEUR-009", severity=_HIGH, id="missing_description"),
+    _golden("short_description", "HEUR-009", id="short_description"),
+    _golden(
+        "base",
+        OperationalRiskCategory.SILENT_FAILURE_PATH,
+        title=("input",),
+        id="missing_input_schema",
+    ),
+    _golden("base", "HEUR-016", title=("output schema",), id="missing_output_schema"),
+    _golden("api_caller", "HEUR-017", title=("authentication",), id="missing_authentication"),
+    _golden("blocker", "HEUR-018", title=("blocking",), id="blocking_operations"),
+    _golden("updater", "HEUR-019", title=("idempotency",), id="missing_idempotency"),
+    _golden("base", "HEUR-020", title=("version",), id="missing_version"),
+    _golden("deprecated", "HEUR-021", title=("unstable", "deprecated"), id="deprecated_tool"),
+    _golden("experimental", "HEUR-021", title=("unstable", "deprecated"), id="experimental_tool"),
+    _golden("connector", "HEUR-022", title=("cleanup",), id="missing_resource_cleanup"),
+    _golden("bulk_deleter", "HEUR-023", title=("bulk",), id="bulk_operation_without_safeguards"),
+    _golden("api_tool", "HEUR-024", title=("circuit breaker",), id="missing_circuit_breaker"),
+    _golden("base", "HEUR-025", title=("observability",), id="missing_observability"),
+)
+
+
+# A server entry with a command and args but no timeout
+_BASE_SERVER = {"command": "node", "args": ("server.js",)}
+
+# Single-server config cases: a server entry and the rule ID or category one of its
+# findings must have
+CONFIG_CASES = (
+    pytest.param(_BASE_SERVER, _MTG, id="missing_server_timeout"),
+    pytest.param({"args": ("--help",)}, "HEUR-CFG-002", id="missing_command"),
+    pytest.param(
+        {**_BASE_SERVER, "env": {"API_KEY": "secret123"}}, "HEUR-CFG-003", id="sensitive_env_vars"
+    ),
+)
+
+
+def _lc(findings):
+    """
+    Join the titles of all findings into a lower-cased, newline-separated string.
+
+    Title-only assertions then lower-case each title once and run a single
+    substring search; needles never contain newlines, so they cannot match
+    across two findings.
+    """
+    return "\n".join(f.title for f in findings).lower()
+
+
+def _freeze(value):
+    """Turn a JSON-like value into a hashable key; dicts become sorted item tuples."""
+    if isinstance(value, Mapping):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+@pytest.fixture(scope="module")
+def provider():
+    """One provider for the whole module; rules keep no per-tool state."""
+    return HeuristicProvider()
+
 
 @pytest.fixture
-def provider():
+def analyze(provider, runner):
+    """Run ``provider.analyze_tool`` to completion on the shared runner."""
+    return lambda tool: runner.run(provider.analyze_tool(tool))
+
+
+@pytest.fixture(scope="module")
+def cached_analyze(provider, runner):
+    """
+    Like ``analyze``, but each distinct tool is only analyzed once per module.
+
+    The findings are shared between tests, so they are returned as a tuple
+    and must not be mutated.
+    """
+    cache = {}
+
+    def run(tool):
+        key = _freeze(tool)
+        findings = cache.get(key)
+        if findings is None:
+            findings = cache[key] = tuple(runner.run(provider.analyze_tool(tool)))
+        return findings
+
+    return run
+
+
+@pytest.fixture
+def analyze_config(provider, runner):
+    """Run ``provider.analyze_config`` to completion on the shared runner."""
+    return lambda config: runner.run(provider.analyze_config(config))
+
+
+@pytest.fixture
+def fresh_provider():
+    """A provider with an empty findings cache, for tests that inspect it."""
     return HeuristicProvider()
 
 
@@ -20,8 +205,7 @@ class TestHeuristicProvider:
     def test_provider_is_available(self, provider):
         assert provider.is_available() is True
 
-    @pytest.mark.asyncio
-    async def test_good_tool_minimal_findings(self, provider):
+    def test_good_tool_minimal_findings(self, cached_analyze):
         """A well-configured tool should have minimal findings."""
         good_tool = {
             "name": "file_reader",
@@ -29,7 +213,7 @@ class TestHeuristicProvider:
             "inputSchema": {
                 "type": "object",
                 "properties": {"path": {"type": "string"}},
-                "required": ["path"],
+                "required": ("path",),
             },
             "errorSchema": {
                 "type": "object",
@@ -40,344 +224,191 @@ class TestHeuristicProvider:
             "rateLimit": {"requests": 100, "period": "minute"},
         }
 
-        findings = await provider.analyze_tool(good_tool)
+        findings = cached_analyze(good_tool)
 
         # Good tool should have no high/critical findings
-        high_critical = [
-            f for f in findings if f.severity in (Severity.HIGH, Severity.CRITICAL)
-        ]
-        assert len(high_critical) == 0
-
-    @pytest.mark.asyncio
-    async def test_missing_timeout(self, provider):
-        tool = {"name": "test_tool", "description": "A test tool"}
-        findings = await provider.analyze_tool(tool)
-
-        timeout_findings = [
-            f
-            for f in findings
-            if f.category == OperationalRiskCategory.MISSING_TIMEOUT_GUARD
-        ]
-        assert len(timeout_findings) > 0
-        assert any(f.severity == Severity.HIGH for f in timeout_findings)
-
-    @pytest.mark.asyncio
-    async def test_zero_timeout(self, provider):
-        tool = {"name": "test_tool", "description": "A test tool", "timeout": 0}
-        findings = await provider.analyze_tool(tool)
-
-        timeout_findings = [
-            f
-            for f in findings
-            if f.category == OperationalRiskCategory.MISSING_TIMEOUT_GUARD
-        ]
-        # Should detect zero timeout as invalid
-        assert len(timeout_findings) > 0
-        # At least one finding should mention the zero/invalid timeout
-        assert any("0" in f.description or "invalid" in f.title.lower() for f in timeout_findings)
-
-    @pytest.mark.asyncio
-    async def test_missing_retry_limit(self, provider):
-        tool = {"name": "test_tool", "description": "A test tool", "timeout": 30000}
-        findings = await provider.analyze_tool(tool)
-
-        retry_findings = [
-            f for f in findings if f.category == OperationalRiskCategory.UNSAFE_RETRY_LOOP
-        ]
-        assert len(retry_findings) > 0
-
-    @pytest.mark.asyncio
-    async def test_excessive_capabilities(self, provider):
-        tool = {
-            "name": "test_tool",
-            "description": "A test tool",
-            "timeout": 30000,
-            "capabilities": [f"cap_{i}" for i in range(15)],
-        }
-        findings = await provider.analyze_tool(tool)
+        assert not any(f.severity in _HIGH_OR_CRIT for f in findings)
 
-        scope_findings = [
-            f
-            for f in findings
-            if f.category == OperationalRiskCategory.OVERLOADED_TOOL_SCOPE
-        ]
-        assert len(scope_findings) > 0
+    @pytest.mark.parametrize(("input_name", "expected", "title", "severity"), GOLDEN_CASES)
+    def test_golden_findings(self, cached_analyze, input_name, expected, title, severity):
+        # cached_analyze runs the provider once per distinct input
+        findings = cached_analyze(TOOL_INPUTS[input_name])
+        _assert_finding(findings, expected, title, severity)
 
-    @pytest.mark.asyncio
-    async def test_missing_error_schema(self, provider):
-        tool = {"name": "test_tool", "description": "A test tool", "timeout": 30000}
-        findings = await provider.analyze_tool(tool)
+    def test_zero_timeout(self, cached_analyze):
+        tool = {**BASE_TOOL, "timeout": 0}
+        findings = cached_analyze(tool)
 
-        error_findings = [
-            f
+        # Should detect zero timeout as invalid, mentioning the zero/invalid value
+        assert any(
+            f.category == _MTG and ("0" in f.description or "invalid" in f.title.lower())
             for f in findings
-            if f.category == OperationalRiskCategory.MISSING_ERROR_SCHEMA
-        ]
-        assert len(error_findings) > 0
-
-    @pytest.mark.asyncio
-    async def test_missing_description(self, provider):
-        tool = {"name": "test_tool", "timeout": 30000}
-        findings = await provider.analyze_tool(tool)
-
-        desc_findings = [f for f in findings if "description" in f.title.lower()]
-        assert len(desc_findings) > 0
-        assert any(f.severity == Severity.HIGH for f in desc_findings)
+        )
 
-    @pytest.mark.asyncio
-    async def test_short_description(self, provider):
-        tool = {"name": "test_tool", "description": "Short", "timeout": 30000}
-        findings = await provider.analyze_tool(tool)
-
-        desc_findings = [f for f in findings if "vague" in f.title.lower()]
-        assert len(desc_findings) > 0
-
-    @pytest.mark.asyncio
-    async def test_missing_input_schema(self, provider):
-        tool = {"name": "test_tool", "description": "A test tool", "timeout": 30000}
-        findings = await provider.analyze_tool(tool)
-
-        schema_findings = [f for f in findings if "input" in f.title.lower()]
-        assert len(schema_findings) > 0
-
-    @pytest.mark.asyncio
-    async def test_dangerous_phrases_best_effort(self, provider):
+    def test_excessive_capabilities(self, cached_analyze):
         tool = {
-            "name": "test_tool",
-            "description": "This tool uses best effort semantics",
-            "timeout": 30000,
-        }
-        findings = await provider.analyze_tool(tool)
-
-        phrase_findings = [
-            f for f in findings if "dangerous phrase" in f.title.lower()
-        ]
-        assert len(phrase_findings) > 0
-
-    @pytest.mark.asyncio
-    async def test_dangerous_phrases_ignore_error(self, provider):
-        tool = {
-            "name": "test_tool",
-            "description": "This tool will ignore errors when possible",
-            "timeout": 30000,
+            **BASE_TOOL,
+            "capabilities": _EXCESSIVE_CAPS,
         }
-        findings = await provider.analyze_tool(tool)
+        findings = cached_analyze(tool)
 
-        phrase_findings = [
-            f for f in findings if "dangerous phrase" in f.title.lower()
-        ]
-        assert len(phrase_findings) > 0
+        assert any(f.category == _OVERLOAD for f in findings)
 
-    @pytest.mark.asyncio
-    async def test_dangerous_phrases_fire_and_forget(self, provider):
+    def test_capability_keywords_match_whole_words(self, cached_analyze):
         tool = {
-            "name": "test_tool",
-            "description": "This is a fire and forget operation",
-            "timeout": 30000,
+            **BASE_TOOL,
+            "description": "Returns company settings, addresses and targets for a runner",
         }
-        findings = await provider.analyze_tool(tool)
-
-        phrase_findings = [
-            f for f in findings if "dangerous phrase" in f.title.lower()
-        ]
-        assert len(phrase_findings) > 0
-
-    @pytest.mark.asyncio
-    async def test_config_missing_server_timeout(self, provider):
+        findings = cached_analyze(tool)
+
+        assert not [f for f in findings if f.rule_id == "HEUR-010"]
+
+    @pytest.mark.parametrize(
+        "description",
+        (
+            "This tool uses best effort semantics",
+            "This tool will ignore errors when possible",
+            "This is a fire and forget operation",
+        ),
+        ids=("best_effort", "ignore_error", "fire_and_forget"),
+    )
+    def test_dangerous_phrases(self, cached_analyze, description):
+        tool = {**BASE_TOOL, "description": description}
+        findings = cached_analyze(tool)
+
+        assert "dangerous phrase" in _lc(findings)
+
+    @pytest.mark.parametrize(("server", "expected"), CONFIG_CASES)
+    def test_config_variants(self, analyze_config, server, expected):
+        config = {"mcpServers": {"test_server": server}}
+        _assert_finding(analyze_config(config), expected)
+
+    def test_config_sensitive_env_vars_match_substrings(self, analyze_config):
         config = {
             "mcpServers": {
                 "test_server": {
                     "command": "node",
-                    "args": ["server.js"],
+                    "env": {"GithubToken": "x", "DB_PASSWORD": "y", "PATH": "/usr/bin"},
                 }
             }
         }
-        findings = await provider.analyze_config(config)
+        findings = analyze_config(config)
 
-        timeout_findings = [
-            f
-            for f in findings
-            if f.category == OperationalRiskCategory.MISSING_TIMEOUT_GUARD
+        env_locations = [f.location for f in findings if f.rule_id == "HEUR-CFG-003"]
+        assert env_locations == [
+            "mcpServers.test_server.env.GithubToken",
+            "mcpServers.test_server.env.DB_PASSWORD",
         ]
-        assert len(timeout_findings) > 0
 
-    @pytest.mark.asyncio
-    async def test_config_missing_command(self, provider):
-        config = {"mcpServers": {"test_server": {"args": ["--help"]}}}
-        findings = await provider.analyze_config(config)
+    def test_repeated_tool_uses_cache(self, fresh_provider, runner):
+        tool = dict(BASE_TOOL)
 
-        command_findings = [f for f in findings if "command" in f.title.lower()]
-        assert len(command_findings) > 0
+        first = runner.run(fresh_provider.analyze_tool(tool))
+        second = runner.run(fresh_provider.analyze_tool(dict(reversed(tool.items()))))
 
-    @pytest.mark.asyncio
-    async def test_config_sensitive_env_vars(self, provider):
-        config = {
-            "mcpServers": {
-                "test_server": {
-                    "command": "node",
-                    "env": {"API_KEY": "secret123"},
-                }
-            }
-        }
-        findings = await provider.analyze_config(config)
+        assert second == first
+        assert second is not first
+        assert len(fresh_provider._cache) == 1
 
-        env_findings = [f for f in findings if "environment" in f.title.lower()]
-        assert len(env_findings) > 0
+    def test_cached_findings_are_copies(self, analyze):
+        tool = {**BASE_TOOL, "description": "Opens a file stream"}
 
-    @pytest.mark.asyncio
-    async def test_missing_output_schema(self, provider):
-        """Test that tools without output schema are flagged."""
-        tool = {
-            "name": "test_tool",
-            "description": "A test tool",
-            "timeout": 30000,
-        }
-        findings = await provider.analyze_tool(tool)
+        first = analyze(tool)
+        for finding in first:
+            if finding.evidence:
+                finding.evidence.clear()
+        second = analyze(tool)
 
-        output_findings = [f for f in findings if "output schema" in f.title.lower()]
-        assert len(output_findings) > 0
-        assert any(f.rule_id == "HEUR-016" for f in output_findings)
+        assert any(finding.evidence for finding in second)
+        assert all(a is not b for a, b in zip(first, second, strict=True))
 
-    @pytest.mark.asyncio
-    async def test_missing_authentication(self, provider):
-        """Test that tools mentioning external APIs without auth config are flagged."""
-        tool = {
-            "name": "api_caller",
-            "description": "Calls an external REST API endpoint to fetch data",
-            "timeout": 30000,
-        }
-        findings = await provider.analyze_tool(tool)
+    def test_unserializable_tool_is_analyzed(self, fresh_provider, runner):
+        tool = {**BAD_NO_TIMEOUT, "handler": object()}
 
-        auth_findings = [f for f in findings if "authentication" in f.title.lower()]
-        assert len(auth_findings) > 0
-        assert any(f.rule_id == "HEUR-017" for f in auth_findings)
+        findings = runner.run(fresh_provider.analyze_tool(tool))
 
-    @pytest.mark.asyncio
-    async def test_blocking_operations(self, provider):
-        """Test that blocking operation indicators are detected."""
-        tool = {
-            "name": "blocker",
-            "description": "This operation blocks until the file is ready",
-            "timeout": 30000,
-        }
-        findings = await provider.analyze_tool(tool)
+        assert findings
+        assert len(fresh_provider._cache) == 0
 
-        blocking_findings = [f for f in findings if "blocking" in f.title.lower()]
-        assert len(blocking_findings) > 0
-        assert any(f.rule_id == "HEUR-018" for f in blocking_findings)
+    def test_analyze_tools_matches_analyze_tool(self, analyze, provider, runner):
+        tools = [
+            {"name": "tool_a", "description": "A test tool", "timeout": 30000},
+            {"name": "tool_b", "description": "Another test tool"},
+        ]
 
-    @pytest.mark.asyncio
-    async def test_missing_idempotency(self, provider):
-        """Test that state-changing operations without idempotency docs are flagged."""
-        tool = {
-            "name": "updater",
-            "description": "Updates the user record in the database",
-            "timeout": 30000,
-        }
-        findings = await provider.analyze_tool(tool)
+        results = runner.run(provider.analyze_tools(tools))
 
-        idempotency_findings = [f for f in findings if "idempotency" in f.title.lower()]
-        assert len(idempotency_findings) > 0
-        assert any(f.rule_id == "HEUR-019" for f in idempotency_findings)
+        assert results == [analyze(tool) for tool in tools]
 
-    @pytest.mark.asyncio
-    async def test_missing_version(self, provider):
-        """Test that tools without version info are flagged."""
+    def test_tool_retry_limit_overrides_config(self, cached_analyze):
         tool = {
-            "name": "test_tool",
-            "description": "A test tool",
-            "timeout": 30000,
+            **BASE_TOOL,
+            "maxRetries": 0,
+            "config": {"maxRetries": 50},
         }
-        findings = await provider.analyze_tool(tool)
+        findings = cached_analyze(tool)
 
-        version_findings = [f for f in findings if "version" in f.title.lower()]
-        assert len(version_findings) > 0
-        assert any(f.rule_id == "HEUR-020" for f in version_findings)
+        assert not [f for f in findings if f.rule_id == "HEUR-004"]
 
-    @pytest.mark.asyncio
-    async def test_deprecated_tool(self, provider):
-        """Test that deprecated tools are flagged."""
-        tool = {
-            "name": "old_tool",
-            "description": "This tool is deprecated and will be removed soon",
-            "timeout": 30000,
-        }
-        findings = await provider.analyze_tool(tool)
+    def test_findings_match_validated_models(self, analyze):
+        tool = {**BAD_NO_TIMEOUT, "maxRetries": -1}
+        findings = analyze(tool)
 
-        unstable_findings = [
-            f for f in findings if "unstable" in f.title.lower() or "deprecated" in f.title.lower()
-        ]
-        assert len(unstable_findings) > 0
-        assert any(f.rule_id == "HEUR-021" for f in unstable_findings)
+        assert findings
+        for finding in findings:
+            assert Finding.model_validate(finding.model_dump()) == finding
 
-    @pytest.mark.asyncio
-    async def test_experimental_tool(self, provider):
-        """Test that experimental tools are flagged."""
-        tool = {
-            "name": "new_tool",
-            "description": "This is an experimental feature",
-            "timeout": 30000,
-        }
-        findings = await provider.analyze_tool(tool)
+    def test_read_only_mapping_matches_dict(self, analyze):
+        assert analyze(BASE_TOOL) == analyze(dict(BASE_TOOL))
 
-        unstable_findings = [
-            f for f in findings if "unstable" in f.title.lower() or "deprecated" in f.title.lower()
-        ]
-        assert len(unstable_findings) > 0
-        assert any(f.rule_id == "HEUR-021" for f in unstable_findings)
+    def test_empty_definition_reports_once(self, analyze):
+        for tool in ({}, {"name": "test_tool"}):
+            findings = analyze(tool)
 
-    @pytest.mark.asyncio
-    async def test_missing_resource_cleanup(self, provider):
-        """Test that tools using resources without cleanup docs are flagged."""
-        tool = {
-            "name": "connector",
-            "description": "Opens a database connection to fetch records",
-            "timeout": 30000,
-        }
-        findings = await provider.analyze_tool(tool)
+            assert [f.rule_id for f in findings] == ["HEUR-000"]
+            assert findings[0].severity == _HIGH
 
-        cleanup_findings = [f for f in findings if "cleanup" in f.title.lower()]
-        assert len(cleanup_findings) > 0
-        assert any(f.rule_id == "HEUR-022" for f in cleanup_findings)
+    def test_sync_entry_points_match_async(self, analyze, analyze_config, provider):
+        tool = dict(BAD_NO_TIMEOUT)
+        config = {"mcpServers": {"test_server": {"command": "node"}}}
 
-    @pytest.mark.asyncio
-    async def test_bulk_operation_without_safeguards(self, provider):
-        """Test that bulk operations without safeguards are flagged."""
-        tool = {
-            "name": "bulk_deleter",
-            "description": "Performs batch delete operations on matching records",
-            "timeout": 30000,
-        }
-        findings = await provider.analyze_tool(tool)
+        assert provider.analyze_tool_sync(tool) == analyze(tool)
+        assert provider.analyze_config_sync(config) == analyze_config(config)
 
-        bulk_findings = [f for f in findings if "bulk" in f.title.lower()]
-        assert len(bulk_findings) > 0
-        assert any(f.rule_id == "HEUR-023" for f in bulk_findings)
-
-    @pytest.mark.asyncio
-    async def test_missing_circuit_breaker(self, provider):
-        """Test that tools calling external services without circuit breakers are flagged."""
+    def test_long_timeout_reported_once(self, cached_analyze):
         tool = {
-            "name": "api_tool",
-            "description": "Makes HTTP requests to an external API service",
-            "timeout": 30000,
+            **BASE_TOOL,
+            "timeout": 400000,
+            "timeoutMs": 500000,
+            "timeout_ms": "forever",
         }
-        findings = await provider.analyze_tool(tool)
+        findings = cached_analyze(tool)
 
-        circuit_findings = [f for f in findings if "circuit breaker" in f.title.lower()]
-        assert len(circuit_findings) > 0
-        assert any(f.rule_id == "HEUR-024" for f in circuit_findings)
+        long_timeouts = [f for f in findings if f.rule_id == "HEUR-002"]
+        assert len(long_timeouts) == 1
+        assert long_timeouts[0].evidence == {"field": "timeout", "value": 400000}
 
-    @pytest.mark.asyncio
-    async def test_missing_observability(self, provider):
-        """Test that tools without observability config are flagged."""
+    def test_validation_hints_evidence_is_truncated(self, analyze):
+        properties = {f"field_{i}": {"type": "string"} for i in range(12)}
+        properties["code"] = {"type": "string", "pattern": "^[A-Z]+$"}
         tool = {
-            "name": "test_tool",
-            "description": "A test tool",
-            "timeout": 30000,
+            **BAD_NO_TIMEOUT,
+            "inputSchema": {"type": "object", "properties": properties},
         }
-        findings = await provider.analyze_tool(tool)
+        findings = analyze(tool)
+
+        hints = [f for f in findings if f.rule_id == "HEUR-012"]
+        assert len(hints) == 1
+        assert "has 12 properties (out of 13)" in hints[0].description
+        assert hints[0].evidence == {
+            "properties_without_validation": [f"field_{i}" for i in range(5)],
+            "total_properties": 13,
+        }
+
+    def test_missing_description_still_checks_name(self, cached_analyze):
+        tool = {"name": "delete_records", "timeout": 30000}
+        findings = cached_analyze(tool)
 
-        obs_findings = [f for f in findings if "observability" in f.title.lower()]
-        assert len(obs_findings) > 0
-        assert any(f.rule_id == "HEUR-025" for f in obs_findings)
+        rule_ids = {f.rule_id for f in findings}
+        assert "HEUR-009" in rule_ids
+        assert "HEUR-018" in rule_ids
@@ -1,5 +1,6 @@
 """Tests for report generators."""
 
+import io
 import json
 from datetime import datetime
 
@@ -11,9 +12,29 @@ from mcpreadiness.core.models import (
     ScanResult,
     Severity,
 )
+from mcpreadiness.reports import sarif
 from mcpreadiness.reports.json_report import render_json, render_json_summary
 from mcpreadiness.reports.markdown_report import render_markdown, render_pr_comment
-from mcpreadiness.reports.sarif import render_sarif
+from mcpreadiness.reports.sarif import render_sarif, render_sarif_stream
+
+
+def _sarif_document(result):
+    """Build the whole SARIF document in memory, as the streamed output must serialize."""
+    findings = list(sarif._unique_findings(result.findings))
+    return {
+        "$schema": sarif.SARIF_SCHEMA,
+        "version": "2.1.0",
+        "runs": [
+            {
+                "tool": sarif._build_tool(),
+                "results": [
+                    sarif._build_result(f, i, result.target) for i, f in enumerate(findings)
+                ],
+                "invocations": sarif._build_invocations(result),
+                "properties": sarif._build_run_properties(result),
+            }
+        ],
+    }
 
 
 @pytest.fixture
@@ -177,3 +198,45 @@ class TestSarifReport:
         data = json.loads(output)
         results = data["runs"][0]["results"]
         assert len(results) == 0
+
+    def test_render_sarif_non_string_evidence_keys(self, sample_result):
+        sample_result.findings[0].evidence = {1: "first attempt"}
+        output = render_sarif(sample_result)
+        data = json.loads(output)
+        result = data["runs"][0]["results"][0]
+        assert result["properties"]["evidence"] == {"1": "first attempt"}
+
+    def test_render_sarif_stream_matches_render_sarif(self, sample_result, empty_result):
+        for result in (sample_result, empty_result):
+            buffer = io.StringIO()
+            render_sarif_stream(result, buffer)
+            assert buffer.getvalue() == render_sarif(result)
+
+    def test_render_sarif_dedups_repeated_findings(self, sample_result):
+        sample_result.findings.append(sample_result.findings[0].model_copy())
+
+        deduped = json.loads(render_sarif(sample_result))
+        assert len(deduped["runs"][0]["results"]) == 2
+
+        full = json.loads(render_sarif(sample_result, dedup=False))
+        assert len(full["runs"][0]["results"]) == 3
+
+    def test_render_sarif_batches_match_whole_document(self, sample_result, monkeypatch):
+        monkeypatch.setattr(sarif, "_RESULT_BATCH_SIZE", 1)
+        sample_result.findings.append(
+            sample_result.findings[0].model_copy(update={"title": "Other"})
+        )
+
+        output = render_sarif(sample_result)
+
+        assert output == json.dumps(_sarif_document(sample_result), indent=2)
+
+    def test_render_sarif_logical_locations_opt_in(self, sample_result):
+        data = json.loads(render_sarif(sample_result))
+        location = data["runs"][0]["results"][0]["locations"][0]
+        assert "logicalLocations" not in location
+        assert location["physicalLocation"]["artifactLocation"]["uri"] == "test_tool.json"
+
+        data = json.loads(render_sarif(sample_result, logical_locations=True))
+        location = data["runs"][0]["results"][0]["locations"][0]
+        assert location["logicalLocations"][0]["fullyQualifiedName"] == "tool.test_tool"
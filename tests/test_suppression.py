@@ -0,0 +1,109 @@
+"""Tests for rule suppression."""
+
+from mcpreadiness.core.models import Finding, OperationalRiskCategory, Severity
+from mcpreadiness.core.suppression import SuppressionManager
+
+
+def make_finding(rule_id: str | None) -> Finding:
+    return Finding(
+        category=OperationalRiskCategory.MISSING_TIMEOUT_GUARD,
+        severity=Severity.HIGH,
+        title="Test finding",
+        description="Test description",
+        provider="test",
+        rule_id=rule_id,
+    )
+
+
+class TestSuppressionManager:
+    """Tests for SuppressionManager."""
+
+    def test_cli_rules_suppress(self):
+        manager = SuppressionManager(cli_ignore_rules=["HEUR-001"])
+        findings = [make_finding("HEUR-001"), make_finding("HEUR-002")]
+
+        active, suppressed = manager.filter_findings(findings)
+
+        assert [f.rule_id for f in active] == ["HEUR-002"]
+        assert [f.rule_id for f in suppressed] == ["HEUR-001"]
+
+    def test_ignore_file_rules_suppress(self, tmp_path):
+        ignore_file = tmp_path / ".mcp-readiness-ignore"
+        ignore_file.write_text("# comment\n\nHEUR-002\n  HEUR-003  \n", encoding="utf-8")
+        manager = SuppressionManager(ignore_file_path=ignore_file)
+        findings = [make_finding("HEUR-001"), make_finding("HEUR-002"), make_finding("HEUR-003")]
+
+        active, suppressed = manager.filter_findings(findings)
+
+        assert [f.rule_id for f in active] == ["HEUR-001"]
+        assert [f.rule_id for f in suppressed] == ["HEUR-002", "HEUR-003"]
+
+    def test_missing_ignore_file_is_ignored(self, tmp_path):
+        manager = SuppressionManager(ignore_file_path=tmp_path / "missing")
+        assert manager.get_all_suppressed_rules() == set()
+
+    def test_inline_rules_suppress(self):
+        manager = SuppressionManager(cli_ignore_rules=["HEUR-001"])
+        tool = {"name": "test_tool", "mcp-readiness-ignore": ["HEUR-003"]}
+        findings = [make_finding("HEUR-001"), make_finding("HEUR-002"), make_finding("HEUR-003")]
+
+        active, suppressed = manager.filter_findings(findings, tool)
+
+        assert [f.rule_id for f in active] == ["HEUR-002"]
+        assert [f.rule_id for f in suppressed] == ["HEUR-001", "HEUR-003"]
+
+    def test_inline_rules_are_read_per_call(self):
+        manager = SuppressionManager()
+        tool = {"mcp-readiness-ignore": ["HEUR-001"]}
+        findings = [make_finding("HEUR-001"), make_finding("HEUR-002")]
+        manager.filter_findings(findings, tool)
+
+        tool["mcp-readiness-ignore"].append("HEUR-002")
+        active, suppressed = manager.filter_findings(findings, tool)
+
+        assert active == []
+        assert [f.rule_id for f in suppressed] == ["HEUR-001", "HEUR-002"]
+
+    def test_inline_rule_string_is_one_rule(self):
+        manager = SuppressionManager()
+        tool = {"mcp-readiness-ignore": "HEUR-001"}
+        findings = [make_finding("HEUR-001"), make_finding("H")]
+
+        active, suppressed = manager.filter_findings(findings, tool)
+
+        assert [f.rule_id for f in active] == ["H"]
+        assert [f.rule_id for f in suppressed] == ["HEUR-001"]
+
+    def test_findings_without_rule_id_are_active(self):
+        manager = SuppressionManager(cli_ignore_rules=["HEUR-001"])
+        findings = [make_finding(None)]
+
+        active, suppressed = manager.filter_findings(findings)
+
+        assert len(active) == 1
+        assert suppressed == []
+
+    def test_is_suppressed(self):
+        manager = SuppressionManager(cli_ignore_rules=["HEUR-001"])
+        tool = {"mcp-readiness-ignore": ["HEUR-002"]}
+
+        assert manager.is_suppressed(make_finding("HEUR-001"))
+        assert manager.is_suppressed(make_finding("HEUR-002"), tool)
+        assert not manager.is_suppressed(make_finding("HEUR-002"))
+
+    def test_get_all_suppressed_rules(self, tmp_path):
+        ignore_file = tmp_path / ".mcp-readiness-ignore"
+        ignore_file.write_text("HEUR-002\n", encoding="utf-8")
+        manager = SuppressionManager(cli_ignore_rules=["HEUR-001"], ignore_file_path=ignore_file)
+
+        assert manager.get_all_suppressed_rules() == {"HEUR-001", "HEUR-002"}
+
+    def test_no_rules_returns_copy(self):
+        manager = SuppressionManager()
+        findings = [make_finding("HEUR-001")]
+
+        active, suppressed = manager.filter_findings(findings, {"name": "test_tool"})
+
+        assert active == findings
+        assert active is not findings
+        assert suppressed == []